@@ -0,0 +1,18 @@
+"""Lazily built, memoized API clients shared by the test and utility scripts."""
+
+from functools import lru_cache
+from config import Config
+
+
+@lru_cache(maxsize=1)
+def get_om():
+    """Get the shared OrderManager for Config.PRIVATE_KEY."""
+    from order_manager import OrderManager
+    return OrderManager(Config.PRIVATE_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_discovery():
+    """Get the shared MarketDiscovery instance."""
+    from market_discovery import MarketDiscovery
+    return MarketDiscovery()
@@ -2,9 +2,13 @@
 from web3 import Web3
 from config import Config
 from logger import logger
+from polymarket_contracts import (
+    CTF_ADDRESS, INDEX_SETS, PARENT_COLLECTION_ID, REDEEM_ABI, USDC_ADDRESS
+)
 import requests
 from typing import Dict, List
 
+
 class AutoRedeemer:
     """Automatically redeems winning positions."""
 
@@ -19,27 +23,7 @@ class AutoRedeemer:
         self.account = self.w3.eth.account.from_key(private_key)
         self.wallet = self.account.address
 
-        # Contract setup
-        self.CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-        self.USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-
-        self.REDEEM_ABI = [{
-            "constant": False,
-            "inputs": [
-                {"name": "collateralToken", "type": "address"},
-                {"name": "parentCollectionId", "type": "bytes32"},
-                {"name": "conditionId", "type": "bytes32"},
-                {"name": "indexSets", "type": "uint256[]"}
-            ],
-            "name": "redeemPositions",
-            "outputs": [],
-            "type": "function"
-        }]
-
-        self.ctf = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.CTF_ADDRESS),
-            abi=self.REDEEM_ABI
-        )
+        self.ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=REDEEM_ABI)
 
     def check_and_redeem_all(self):
         """
@@ -52,9 +36,13 @@ class AutoRedeemer:
             - amount: float (total value redeemed)
         """
         try:
-            # Fetch positions from Polymarket API
-            api_url = f"https://data-api.polymarket.com/positions?user={self.wallet}"
-            response = requests.get(api_url, timeout=10)
+            # Fetch only redeemable positions; the API filters server-side
+            api_url = "https://data-api.polymarket.com/positions"
+            response = requests.get(
+                api_url,
+                params={'user': self.wallet, 'redeemable': 'true'},
+                timeout=10
+            )
 
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch positions (status {response.status_code})")
@@ -71,18 +59,15 @@ class AutoRedeemer:
             if not redeemable:
                 return 0, []
 
-            # Group by condition ID
+            # Group by condition ID, accumulating market values in the same pass
             by_condition: Dict[str, List] = {}
+            market_values: Dict[str, float] = {}
             for pos in redeemable:
                 cid = pos['conditionId']
-                if cid not in by_condition:
-                    by_condition[cid] = []
-                by_condition[cid].append(pos)
+                by_condition.setdefault(cid, []).append(pos)
+                market_values[cid] = market_values.get(cid, 0) + pos['currentValue']
 
-            total_value = sum(
-                sum(p['currentValue'] for p in positions)
-                for positions in by_condition.values()
-            )
+            total_value = sum(market_values.values())
 
             logger.info(f"Found {len(redeemable)} redeemable positions worth ${total_value:.2f}")
 
@@ -92,7 +77,7 @@ class AutoRedeemer:
 
             for cid, positions in by_condition.items():
                 market_title = positions[0]['title']
-                market_value = sum(p['currentValue'] for p in positions)
+                market_value = market_values[cid]
 
                 logger.info(f"Redeeming: {market_title} (${market_value:.2f})")
 
@@ -117,26 +102,25 @@ class AutoRedeemer:
     def _redeem_condition(self, condition_id: str) -> bool:
         """Redeem a single condition."""
         try:
-            collateral_token = Web3.to_checksum_address(self.USDC_ADDRESS)
-            parent_collection_id = b'\x00' * 32
             condition_id_bytes = bytes.fromhex(condition_id[2:])
-            index_sets = [1, 2]
 
             nonce = self.w3.eth.get_transaction_count(self.wallet)
             gas_price = self.w3.eth.gas_price
 
-            redeem_txn = self.ctf.functions.redeemPositions(
-                collateral_token,
-                parent_collection_id,
-                condition_id_bytes,
-                index_sets
-            ).build_transaction({
+            # Encode directly; every field build_transaction would fill is already known
+            redeem_txn = {
                 'from': self.wallet,
+                'to': CTF_ADDRESS,
+                'data': self.ctf.encode_abi(
+                    'redeemPositions',
+                    args=[USDC_ADDRESS, PARENT_COLLECTION_ID, condition_id_bytes, INDEX_SETS]
+                ),
+                'value': 0,
                 'nonce': nonce,
                 'gas': 300000,
                 'gasPrice': gas_price,
                 'chainId': 137
-            })
+            }
 
             # Estimate gas
             try:
@@ -145,7 +129,7 @@ class AutoRedeemer:
             except:
                 pass
 
-            signed_txn = self.w3.eth.account.sign_transaction(redeem_txn, Config.PRIVATE_KEY)
+            signed_txn = self.account.sign_transaction(redeem_txn)
             tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
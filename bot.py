@@ -463,24 +463,26 @@ class PolymarketBot:
             if market.end_timestamp < (datetime.now().timestamp() - 3600):
                 continue
 
-            # Check each order
-            for order in orders:
-                if order.status in [OrderStatus.PLACED, OrderStatus.PARTIALLY_FILLED]:
-                    # Capture original status before update
-                    original_status = order.status
+            # Check all open orders for this market in one batch
+            open_orders = [
+                order for order in orders
+                if order.status in [OrderStatus.PLACED, OrderStatus.PARTIALLY_FILLED]
+            ]
+            # Capture original statuses before update
+            original_statuses = {order.order_id: order.status for order in open_orders}
+            self.order_manager.check_orders_status(open_orders)
 
-                    updated_order = self.order_manager.check_order_status(order)
+            for order in orders:
+                original_status = original_statuses.get(order.order_id)
 
-                    # Log status changes
-                    if updated_order.status != original_status:
-                        logger.info(
-                            f"Order {order.order_id} status changed: "
-                            f"{original_status.value} -> {updated_order.status.value}"
-                        )
-                        status_changed = True
-                    self._upsert_order_history(updated_order)
-                else:
-                    self._upsert_order_history(order)
+                # Log status changes
+                if original_status is not None and order.status != original_status:
+                    logger.info(
+                        f"Order {order.order_id} status changed: "
+                        f"{original_status.value} -> {order.status.value}"
+                    )
+                    status_changed = True
+                self._upsert_order_history(order)
 
             now = datetime.now()
 
@@ -1,39 +1,9 @@
 """Check all USDC and CTF allowances for Polymarket."""
 from web3 import Web3
 from config import Config
+from polymarket_contracts import CTF_ABI, CTF_ADDRESS, SPENDERS, USDC_ABI, USDC_ADDRESS
 
 RPC_URL = Config.RPC_URL
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-
-# All spenders
-SPENDERS = [
-    ("0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E", "CTF Exchange"),
-    ("0xC5d563A36AE78145C45a50134d48A1215220f80a", "Neg Risk CTF Exchange"),
-    ("0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296", "Neg Risk Adapter")
-]
-
-ERC20_ABI = [{
-    "constant": True,
-    "inputs": [
-        {"name": "_owner", "type": "address"},
-        {"name": "_spender", "type": "address"}
-    ],
-    "name": "allowance",
-    "outputs": [{"name": "", "type": "uint256"}],
-    "type": "function"
-}]
-
-ERC1155_ABI = [{
-    "constant": True,
-    "inputs": [
-        {"name": "account", "type": "address"},
-        {"name": "operator", "type": "address"}
-    ],
-    "name": "isApprovedForAll",
-    "outputs": [{"name": "", "type": "bool"}],
-    "type": "function"
-}]
 
 w3 = Web3(Web3.HTTPProvider(RPC_URL))
 if not w3.is_connected():
@@ -49,15 +19,9 @@ print(f'Checking Allowances for Wallet: {wallet}\n')
 print('='*70)
 
 # Create contracts
-usdc = w3.eth.contract(
-    address=Web3.to_checksum_address(USDC_ADDRESS),
-    abi=ERC20_ABI
-)
-
-ctf = w3.eth.contract(
-    address=Web3.to_checksum_address(CTF_ADDRESS),
-    abi=ERC1155_ABI
-)
+usdc = w3.eth.contract(address=USDC_ADDRESS, abi=USDC_ABI)
+
+ctf = w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI)
 
 all_good = True
 
@@ -18,6 +18,7 @@ class Config:
 
     # Bot Configuration
     ORDER_SIZE_USD: float = float(os.getenv("ORDER_SIZE_USD", "10.0"))
+    ORDER_SIZE_USD_CENTS: int = round(ORDER_SIZE_USD * 100)
     SPREAD_OFFSET: float = float(os.getenv("SPREAD_OFFSET", "0.01"))
     CHECK_INTERVAL_SECONDS: int = int(os.getenv("CHECK_INTERVAL_SECONDS", "60"))
     ORDER_PLACEMENT_MIN_MINUTES: int = int(os.getenv("ORDER_PLACEMENT_MIN_MINUTES", "10"))
@@ -50,9 +51,12 @@ class Config:
     GAMMA_API_BASE_URL: str = os.getenv("GAMMA_API_BASE_URL", "https://gamma-api.polymarket.com")
     CLOB_API_URL: str = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
     RPC_URL: str = os.getenv("RPC_URL", "https://polygon-rpc.com")
+    WS_RPC_URL: str = os.getenv("WS_RPC_URL", "wss://polygon-bor-rpc.publicnode.com")
     POLYMARKET_API_KEY: Optional[str] = os.getenv("POLYMARKET_API_KEY")
     POLYMARKET_API_SECRET: Optional[str] = os.getenv("POLYMARKET_API_SECRET")
     POLYMARKET_API_PASSPHRASE: Optional[str] = os.getenv("POLYMARKET_API_PASSPHRASE", "")
+    CLOB_RATE_LIMIT_PER_SECOND: float = float(os.getenv("CLOB_RATE_LIMIT_PER_SECOND", "50"))
+    MARKET_CACHE_TTL_SECONDS: int = int(os.getenv("MARKET_CACHE_TTL_SECONDS", "300"))
 
     # Dashboard Configuration
     DASHBOARD_HOST: str = os.getenv("DASHBOARD_HOST", "0.0.0.0")
@@ -71,6 +75,8 @@ class Config:
             raise ValueError("ORDER_SIZE_USD must be positive")
         if cls.SPREAD_OFFSET <= 0:
             raise ValueError("SPREAD_OFFSET must be positive")
+        if cls.CLOB_RATE_LIMIT_PER_SECOND <= 0:
+            raise ValueError("CLOB_RATE_LIMIT_PER_SECOND must be positive")
         return True
 
 
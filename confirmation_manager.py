@@ -0,0 +1,219 @@
+"""Event-driven transaction confirmation over a WebSocket newHeads subscription."""
+
+import asyncio
+from typing import Dict
+from web3 import AsyncHTTPProvider, AsyncWeb3, WebSocketProvider
+from web3.exceptions import TransactionNotFound
+from config import Config
+from logger import logger
+
+
+class ConfirmationManager:
+    """
+    Resolve transaction receipts when new blocks arrive instead of polling.
+
+    If the WebSocket subscription cannot be opened, or drops and cannot be
+    re-established, waits fall back to HTTP receipt polling.
+    """
+
+    def __init__(self, ws_url: str = None, fallback_w3: AsyncWeb3 = None):
+        """
+        Initialize the manager.
+
+        Args:
+            ws_url: WebSocket RPC endpoint (defaults to Config.WS_RPC_URL)
+            fallback_w3: AsyncWeb3 used for HTTP polling when the subscription is
+                unavailable (defaults to one on Config.RPC_URL)
+        """
+        self.ws_url = ws_url or Config.WS_RPC_URL
+        self._fallback_w3 = fallback_w3
+        self._w3 = None
+        self._listener = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        # The listener and every wait() call check receipts; run one check at a time
+        self._check_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        try:
+            await self._connect()
+        except Exception as e:
+            logger.warning("newHeads subscription unavailable, polling receipts over HTTP: %s", e)
+        else:
+            self._listener = asyncio.create_task(self._listen())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        await self._disconnect()
+        return False
+
+    async def _connect(self):
+        """Open the WebSocket connection and subscribe to newHeads."""
+        w3 = await AsyncWeb3(WebSocketProvider(self.ws_url))
+        try:
+            await w3.eth.subscribe('newHeads')
+        except Exception:
+            await w3.provider.disconnect()
+            raise
+        self._w3 = w3
+
+    async def _disconnect(self):
+        """Close the WebSocket connection, if any."""
+        if self._w3 is None:
+            return
+        try:
+            await self._w3.provider.disconnect()
+        except Exception as e:
+            logger.debug("Error closing WebSocket provider: %s", e)
+        self._w3 = None
+
+    @property
+    def _subscribed(self) -> bool:
+        """Whether the newHeads listener is still running."""
+        return self._listener is not None and not self._listener.done()
+
+    async def _listen(self):
+        """Check pending receipts once per new block head, re-subscribing once if dropped."""
+        for attempt in range(2):
+            try:
+                async for _ in self._w3.socket.process_subscriptions():
+                    try:
+                        await self._check_pending()
+                    except Exception as e:
+                        logger.warning("Receipt check failed, retrying on the next head: %s", e)
+            except Exception as e:
+                logger.warning("newHeads subscription dropped: %s", e)
+
+            await self._disconnect()
+            if attempt == 0:
+                try:
+                    await self._connect()
+                    continue
+                except Exception as e:
+                    logger.warning("Could not re-establish newHeads subscription: %s", e)
+            break
+
+        logger.warning("Falling back to HTTP receipt polling")
+
+    async def _check_pending(self):
+        """Check inclusion of every pending hash in one JSON-RPC batch."""
+        async with self._check_lock:
+            await self._check_pending_locked()
+
+    async def _check_pending_locked(self):
+        """Body of _check_pending; must run under _check_lock."""
+        hashes = list(self._pending)
+        if not hashes:
+            return
+
+        # Transactions show a blockNumber as soon as they are included, which many
+        # providers serve faster than receipts; fetch each receipt only once mined
+        responses = await self._w3.provider.make_batch_request(
+            [('eth_getTransactionByHash', [tx_hash]) for tx_hash in hashes]
+        )
+
+        for tx_hash, response in zip(hashes, responses):
+            tx = response.get('result')
+            if not tx or not tx.get('blockNumber'):
+                continue
+            future = self._pending.get(tx_hash)
+            if future is None or future.done():
+                continue
+            try:
+                receipt = await self._w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                # Included but the receipt isn't served yet; retry on the next head
+                continue
+            except Exception as e:
+                outcome = (future.set_exception, e)
+            else:
+                outcome = (future.set_result, receipt)
+            self._pending.pop(tx_hash, None)
+            # The waiter may have timed out (cancelling the future) during the await
+            if not future.done():
+                set_outcome, value = outcome
+                set_outcome(value)
+
+    async def wait(self, tx_hash, timeout: float = 120):
+        """
+        Wait for a transaction to be mined.
+
+        Args:
+            tx_hash: Transaction hash (bytes or 0x-prefixed hex)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Transaction receipt
+        """
+        if isinstance(tx_hash, (bytes, bytearray)):
+            tx_hash = '0x' + bytes(tx_hash).hex()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if not self._subscribed:
+            return await self._poll_receipt(tx_hash, timeout)
+
+        future = loop.create_future()
+        self._pending[tx_hash] = future
+
+        try:
+            # The transaction may already be mined before the next head arrives
+            try:
+                await self._check_pending()
+            except Exception as e:
+                logger.debug("Initial receipt check failed: %s", e)
+
+            # Also wake up if the listener gives up, so the wait can fall back to HTTP
+            await asyncio.wait({future, self._listener}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if future.done():
+                return future.result()
+        finally:
+            self._pending.pop(tx_hash, None)
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError(f"Transaction {tx_hash} not mined within {timeout}s")
+        return await self._poll_receipt(tx_hash, remaining)
+
+    async def _poll_receipt(self, tx_hash: str, timeout: float, poll_latency: float = 1.0):
+        """Wait for a receipt by polling the HTTP RPC, checking inclusion before fetching it."""
+        if self._fallback_w3 is None:
+            self._fallback_w3 = AsyncWeb3(AsyncHTTPProvider(Config.RPC_URL))
+        w3 = self._fallback_w3
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            # Same order as the newHeads path: the receipt is only requested once mined
+            try:
+                tx = await w3.eth.get_transaction(tx_hash)
+            except TransactionNotFound:
+                tx = None
+            if tx is not None and tx.get('blockNumber') is not None:
+                try:
+                    return await w3.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    pass
+
+            if loop.time() + poll_latency > deadline:
+                raise asyncio.TimeoutError(f"Transaction {tx_hash} not mined within {timeout}s")
+            await asyncio.sleep(poll_latency)
+
+
+def wait_for_receipt(tx_hash, timeout: float = 120):
+    """
+    Synchronously wait for one transaction receipt via a ConfirmationManager.
+
+    For one-shot scripts: uses the newHeads subscription when Config.WS_RPC_URL
+    is reachable and falls back to HTTP polling on Config.RPC_URL otherwise.
+    """
+    async def _wait():
+        async with ConfirmationManager() as manager:
+            return await manager.wait(tx_hash, timeout)
+
+    return asyncio.run(_wait())
@@ -92,7 +92,7 @@ class CTFMerger:
                 logger.warning(f"Could not estimate gas: {e}, using default")
 
             # Sign and send
-            signed_txn = self.w3.eth.account.sign_transaction(merge_txn, Config.PRIVATE_KEY)
+            signed_txn = self.account.sign_transaction(merge_txn)
             tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
             logger.info(f"Merge transaction sent: {tx_hash.hex()}")
@@ -0,0 +1,91 @@
+"""On-disk SQLite cache of discovered BTC 15-minute markets."""
+
+import sqlite3
+import time
+from typing import Callable, Optional
+from config import Config
+from models import Market
+from logger import logger
+from _clients import get_discovery
+
+CACHE_DB_PATH = "markets_cache.db"
+
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Get the shared cache connection, creating the schema on first use."""
+    global _conn
+    if _conn is not None:
+        return _conn
+
+    conn = sqlite3.connect(CACHE_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS markets ("
+        "market_slug TEXT PRIMARY KEY, "
+        "end_timestamp INTEGER NOT NULL, "
+        "data TEXT NOT NULL, "
+        "fetched_at REAL NOT NULL DEFAULT 0)"
+    )
+    # Caches written before fetched_at existed: their rows count as stale
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(markets)")}
+    if "fetched_at" not in columns:
+        conn.execute("ALTER TABLE markets ADD COLUMN fetched_at REAL NOT NULL DEFAULT 0")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_markets_end_timestamp ON markets (end_timestamp)"
+    )
+    conn.commit()
+    _conn = conn
+    return conn
+
+
+def store(market: Market):
+    """Insert or replace a market in the cache."""
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO markets (market_slug, end_timestamp, data, fetched_at) "
+            "VALUES (?, ?, ?, ?)",
+            (market.market_slug, market.end_timestamp, market.model_dump_json(), time.time())
+        )
+
+
+def _lookup(query: str, param, fetch: Callable[[object], Optional[Market]]) -> Optional[Market]:
+    """
+    Run an indexed single-market lookup, fetching just that market on a miss.
+
+    Resolved markets never change and are served from the cache indefinitely;
+    unresolved ones are refetched once older than Config.MARKET_CACHE_TTL_SECONDS.
+    """
+    row = _connect().execute(query, (param,)).fetchone()
+    cached = None
+    if row:
+        cached = Market.model_validate_json(row[0])
+        if cached.is_resolved or time.time() - row[1] < Config.MARKET_CACHE_TTL_SECONDS:
+            return cached
+
+    market = fetch(param)
+    if market:
+        store(market)
+        logger.debug("Cached market %s", market.market_slug)
+        return market
+    # A stale entry still beats nothing if the market has dropped out of the API
+    return cached
+
+
+def get_market_by_slug(slug: str) -> Optional[Market]:
+    """Get a market by slug, from the cache or the Gamma API."""
+    return _lookup(
+        "SELECT data, fetched_at FROM markets WHERE market_slug = ?",
+        slug,
+        lambda s: get_discovery().get_market(s)
+    )
+
+
+def get_market_by_end_time(end_timestamp: int) -> Optional[Market]:
+    """Get a market by its end timestamp, from the cache or the Gamma API."""
+    return _lookup(
+        "SELECT data, fetched_at FROM markets WHERE end_timestamp = ?",
+        end_timestamp,
+        lambda ts: get_discovery().get_market_by_end_time(ts)
+    )
@@ -60,6 +60,32 @@ class MarketDiscovery:
             logger.error(f"Error discovering markets: {e}", exc_info=True)
             return []
 
+    def get_market(self, slug: str) -> Optional[Market]:
+        """
+        Fetch a single market by slug, filtered server-side.
+
+        Args:
+            slug: Market slug (e.g., btc-updown-15m-1766134800)
+
+        Returns:
+            Market if found, None otherwise
+        """
+        market_data = self._fetch_market_by_slug(slug)
+        return self._parse_market(market_data) if market_data else None
+
+    def get_market_by_end_time(self, end_timestamp: int) -> Optional[Market]:
+        """
+        Fetch the BTC 15m market ending at a given time.
+
+        Args:
+            end_timestamp: Unix timestamp the market ends at
+
+        Returns:
+            Market if found, None otherwise
+        """
+        # Slugs carry the start timestamp; markets run for 15 minutes
+        return self.get_market(f"btc-updown-15m-{end_timestamp - 15 * 60}")
+
     def _generate_15min_timestamps(self, count: int) -> List[int]:
         """
         Generate upcoming 15-minute interval timestamps.
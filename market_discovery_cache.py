@@ -0,0 +1,77 @@
+"""Short-lived shared cache of BTC 15-minute market discovery results."""
+
+import json
+import time
+from typing import Dict, List, Optional
+from models import Market
+from logger import logger
+
+CACHE_FILE = ".market_discovery_cache.json"
+CACHE_TTL_SECONDS = 60
+
+# Non-empty results for the current TTL bucket only
+_memo: Dict[int, List[Market]] = {}
+
+
+def _load(bucket: int) -> Optional[List[Market]]:
+    """Load cached markets if the file was written in the same TTL bucket."""
+    try:
+        with open(CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("bucket") != bucket:
+        return None
+    return [Market.model_validate(data) for data in cached.get("markets", [])]
+
+
+def _save(bucket: int, markets: List[Market]):
+    """Write markets to the cache file, ignoring write errors."""
+    try:
+        with open(CACHE_FILE, "w") as f:
+            json.dump({
+                "bucket": bucket,
+                "markets": [market.model_dump(mode="json") for market in markets]
+            }, f)
+    except OSError as e:
+        logger.debug(f"Could not write {CACHE_FILE}: {e}")
+
+
+def _markets_for_bucket(bucket: int) -> List[Market]:
+    """
+    Get markets for a TTL bucket from memory or disk, or run discovery on a miss.
+
+    Empty results are not cached, so a failed or premature discovery is retried
+    on the next call instead of being served for the rest of the bucket.
+    """
+    if bucket in _memo:
+        return _memo[bucket]
+
+    markets = _load(bucket)
+    if markets is not None:
+        logger.debug("Using %d cached BTC 15m markets", len(markets))
+    else:
+        from _clients import get_discovery
+
+        markets = get_discovery().discover_btc_15m_markets()
+        if markets:
+            _save(bucket, markets)
+
+    if markets:
+        _memo.clear()
+        _memo[bucket] = markets
+    return markets
+
+
+def get_btc_15m_markets() -> List[Market]:
+    """
+    Get BTC 15m markets, re-running discovery at most once per CACHE_TTL_SECONDS.
+
+    Results are shared in-process and on disk, so back-to-back script runs
+    reuse the same discovery.
+
+    Returns:
+        List of Market objects for BTC 15m markets
+    """
+    return _markets_for_bucket(int(time.time() // CACHE_TTL_SECONDS))
@@ -1,15 +1,44 @@
 """Order management for Polymarket limit orders."""
 
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Optional, Dict, Tuple
 from decimal import Decimal
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, OrderType, ApiCreds
 from py_clob_client.constants import POLYGON
 from models import Market, OrderRecord, OrderSide, OrderStatus, Outcome
 from logger import logger
 from config import Config
+from rate_limiter import TokenBucket
+
+# Prices are quoted on a 0.01 grid, valid ticks are 1..99
+TICKS_PER_DOLLAR = 100
+MIN_PRICE_TICK = 1
+MAX_PRICE_TICK = 99
+
+# Plain string sides for OrderArgs, avoiding an enum .value lookup per order
+_SIDE_VALUE = {OrderSide.BUY: "BUY", OrderSide.SELL: "SELL"}
+
+# Fields read from every CLOB order details payload, fetched in one call
+_ORDER_DETAIL_FIELDS = itemgetter("status", "size_matched", "original_size")
+
+# Upper bound on concurrent order submissions per placement cycle
+MAX_PLACEMENT_WORKERS = 8
+
+# How long a fetched USDC balance is reused before hitting the RPC again
+BALANCE_CACHE_TTL_SECONDS = 2.0
+
+
+def price_to_tick(price: float) -> int:
+    """Convert a price to an integer tick clamped to the valid range."""
+    return max(MIN_PRICE_TICK, min(MAX_PRICE_TICK, round(price * TICKS_PER_DOLLAR)))
 
 
 class OrderManager:
@@ -25,6 +54,11 @@ class OrderManager:
         self.private_key = private_key
         self.client = None
         self.address = None
+        self.session = self._create_http_session()
+        self._w3 = None
+        self._balance_cache = (0.0, 0.0)  # (monotonic timestamp, balance)
+        # Paces post/cancel requests to the CLOB rate budget
+        self._limiter = TokenBucket(rate=Config.CLOB_RATE_LIMIT_PER_SECOND)
         self._initialize_client()
 
     def _initialize_client(self):
@@ -50,7 +84,7 @@ class OrderManager:
                     self.client.set_api_creds(creds)
                     logger.info("API credentials derived and set successfully")
                 except Exception as e:
-                    logger.warning(f"Could not derive API credentials: {e}")
+                    logger.warning("Could not derive API credentials: %s", e)
                     logger.warning("Will continue without L2 authentication (read-only mode)")
             elif Config.SIGNATURE_TYPE in ["POLY_PROXY", "POLY_GNOSIS_SAFE"]:
                 if not Config.FUNDER_ADDRESS:
@@ -66,17 +100,74 @@ class OrderManager:
             else:
                 raise ValueError(f"Invalid SIGNATURE_TYPE: {Config.SIGNATURE_TYPE}")
 
+            # Reuse pooled keep-alive connections for all CLOB REST calls
+            self._configure_clob_http()
+
             # Derive address
             self.address = self.client.get_address()
-            logger.info(f"Initialized CLOB client for address: {self.address}")
+            logger.info("Initialized CLOB client for address: %s", self.address)
 
             # Set allowances for USDC and CTF exchange
             self._set_allowances()
 
         except Exception as e:
-            logger.error(f"Failed to initialize CLOB client: {e}", exc_info=True)
+            logger.error("Failed to initialize CLOB client: %s", e, exc_info=True)
             raise
 
+    def _create_http_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session shared by all RPC calls."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[429, 502, 503, 504],
+                # JSON-RPC calls are POSTs, which urllib3 does not retry by default.
+                # Re-sending them is safe: reads are idempotent and a re-broadcast
+                # signed transaction is rejected as already known
+                allowed_methods=frozenset(["GET", "POST"])
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def _configure_clob_http(self):
+        """Size the CLOB client's keep-alive connection pool."""
+        try:
+            # py_clob_client sends every REST call through one module-level httpx
+            # client, so this replaces the transport for every ClobClient in the
+            # process, not just self.client
+            import httpx
+            from py_clob_client.http_helpers import helpers as clob_http
+
+            if isinstance(getattr(clob_http, "_http_client", None), httpx.Client):
+                clob_http._http_client = httpx.Client(
+                    http2=True,
+                    # Bound every CLOB call so a stalled endpoint fails instead of hanging
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+                    headers={"Connection": "keep-alive"}
+                )
+                logger.debug("CLOB HTTP client configured with pooled keep-alive connections")
+        except Exception as e:
+            logger.warning("Could not configure CLOB HTTP connection pool: %s", e)
+
+    def _get_web3(self):
+        """Get a Web3 instance bound to the shared keep-alive session."""
+        if self._w3 is None:
+            from web3 import Web3
+
+            self._w3 = Web3(Web3.HTTPProvider(
+                Config.RPC_URL,
+                session=self.session,
+                request_kwargs={"timeout": 10}
+            ))
+        return self._w3
+
     def _set_allowances(self):
         """Set token allowances for trading."""
         try:
@@ -87,19 +178,27 @@ class OrderManager:
                 result = self.client.update_balance_allowance()
                 logger.info("Balance allowance updated successfully")
             except Exception as e:
-                logger.warning(f"Could not update allowances: {e}")
+                logger.warning("Could not update allowances: %s", e)
                 logger.info("Allowances may already be set or need manual setup")
 
         except Exception as e:
-            logger.error(f"Error setting allowances: {e}")
+            logger.error("Error setting allowances: %s", e)
 
     def get_usdc_balance(self) -> float:
-        """Get USDC balance directly from wallet on Polygon blockchain."""
+        """Get USDC balance directly from wallet on Polygon blockchain.
+
+        Successful reads are cached for BALANCE_CACHE_TTL_SECONDS so repeated
+        placement cycles don't refetch the balance every time.
+        """
+        cached_at, cached_balance = self._balance_cache
+        if cached_at and time.monotonic() - cached_at < BALANCE_CACHE_TTL_SECONDS:
+            return cached_balance
+
         try:
             from web3 import Web3
 
             # Connect to Polygon RPC
-            w3 = Web3(Web3.HTTPProvider(Config.RPC_URL))
+            w3 = self._get_web3()
             if not w3.is_connected():
                 logger.error("Cannot connect to Polygon RPC")
                 return 0.0
@@ -123,10 +222,12 @@ class OrderManager:
             balance_wei = usdc_contract.functions.balanceOf(self.address).call()
             usdc_balance = balance_wei / 1e6  # USDC has 6 decimals
 
-            logger.debug(f"USDC balance from wallet: ${usdc_balance:.2f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("USDC balance from wallet: $%.2f", usdc_balance)
+            self._balance_cache = (time.monotonic(), usdc_balance)
             return usdc_balance
         except Exception as e:
-            logger.error(f"Error getting USDC balance from wallet: {e}", exc_info=True)
+            logger.error("Error getting USDC balance from wallet: %s", e, exc_info=True)
             return 0.0
 
     def update_market_prices(self, market: Market) -> Market:
@@ -154,22 +255,24 @@ class OrderManager:
                     if hasattr(book, 'asks') and book.asks:
                         outcome.best_ask = float(book.asks[0].price) if hasattr(book.asks[0], 'price') else 0
 
-                    # Set mid price
+                    # Set mid price (on the tick grid)
                     if outcome.best_bid and outcome.best_ask:
-                        outcome.price = (outcome.best_bid + outcome.best_ask) / 2
+                        mid_tick = (price_to_tick(outcome.best_bid) + price_to_tick(outcome.best_ask)) // 2
+                        outcome.price = mid_tick / TICKS_PER_DOLLAR
 
-                    logger.debug(
-                        f"{outcome.outcome}: bid={outcome.best_bid}, "
-                        f"ask={outcome.best_ask}"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "%s: bid=%s, ask=%s",
+                            outcome.outcome, outcome.best_bid, outcome.best_ask
+                        )
 
                 except Exception as e:
-                    logger.warning(f"Could not get orderbook for {outcome.token_id}: {e}")
+                    logger.warning("Could not get orderbook for %s: %s", outcome.token_id, e)
 
             return market
 
         except Exception as e:
-            logger.error(f"Error updating market prices: {e}")
+            logger.error("Error updating market prices: %s", e)
             return market
 
     def calculate_order_size(self, price: float, usd_amount: float) -> float:
@@ -185,9 +288,20 @@ class OrderManager:
         """
         if price <= 0:
             return 0.0
-        shares = usd_amount / price
-        # Round to 2 decimal places for shares
-        return round(shares, 2)
+        return self._size_hundredths(price_to_tick(price), round(usd_amount * 100)) / 100
+
+    def _size_hundredths(self, price_tick: int, usd_cents: int) -> int:
+        """
+        Calculate order size in hundredths of a share using integer math.
+
+        Args:
+            price_tick: Order price in ticks (cents)
+            usd_cents: USD amount to trade in cents
+
+        Returns:
+            Number of shares x 100, rounded down so cost never exceeds the amount
+        """
+        return (usd_cents * 100) // price_tick
 
     def place_simple_test_orders(
         self,
@@ -217,7 +331,8 @@ class OrderManager:
 
             if balance > 0 and balance < required_balance:
                 logger.error(
-                    f"Insufficient balance: ${balance:.2f} < ${required_balance:.2f}"
+                    "Insufficient balance: $%.2f < $%.2f",
+                    balance, required_balance
                 )
                 return placed_orders
             elif balance == 0:
@@ -230,9 +345,9 @@ class OrderManager:
             yes_outcome = None
             no_outcome = None
 
-            logger.info(f"Market has {len(market.outcomes)} outcomes")
+            logger.info("Market has %s outcomes", len(market.outcomes))
             for outcome in market.outcomes:
-                logger.info(f"  Outcome: '{outcome.outcome}' (token_id: {outcome.token_id})")
+                logger.info("  Outcome: '%s' (token_id: %s)", outcome.outcome, outcome.token_id)
                 outcome_upper = outcome.outcome.upper()
                 if outcome_upper in ["YES", "UP"]:
                     yes_outcome = outcome
@@ -259,9 +374,6 @@ class OrderManager:
             if yes_order:
                 placed_orders.append(yes_order)
 
-            # Small delay between orders
-            time.sleep(0.5)
-
             # Place order on No
             no_order = self._place_single_order_fixed(
                 market=market,
@@ -275,12 +387,12 @@ class OrderManager:
                 placed_orders.append(no_order)
 
             logger.info(
-                f"Placed {len(placed_orders)} test orders for market {market.market_slug} "
-                f"at ${price:.2f} with {size:.2f} shares each"
+                "Placed %s test orders for market %s at $%.2f with %.2f shares each",
+                len(placed_orders), market.market_slug, price, size
             )
 
         except Exception as e:
-            logger.error(f"Error placing test orders: {e}", exc_info=True)
+            logger.error("Error placing test orders: %s", e, exc_info=True)
 
         return placed_orders
 
@@ -307,17 +419,19 @@ class OrderManager:
 
             if balance < required_balance:
                 logger.error(
-                    f"Insufficient balance: ${balance:.2f} < ${required_balance:.2f}"
+                    "Insufficient balance: $%.2f < $%.2f",
+                    balance, required_balance
                 )
                 return placed_orders
 
             # Update market prices
             market = self.update_market_prices(market)
 
-            # Place orders for each outcome
+            # Build the full outcome x side plan up front
+            plan = []
             for outcome in market.outcomes:
                 if not outcome.token_id or not outcome.best_bid or not outcome.best_ask:
-                    logger.warning(f"Missing data for {outcome.outcome}, skipping")
+                    logger.warning("Missing data for %s, skipping", outcome.outcome)
                     continue
 
                 # Calculate order prices
@@ -329,34 +443,33 @@ class OrderManager:
                     outcome.best_ask + Config.SPREAD_OFFSET,
                     is_buy=False
                 )
-
-                # Place buy order
-                buy_order = self._place_single_order(
-                    market=market,
-                    outcome=outcome,
-                    side=OrderSide.BUY,
-                    price=buy_price
-                )
-                if buy_order:
-                    placed_orders.append(buy_order)
-
-                # Small delay between orders
-                time.sleep(0.5)
-
-                # Place sell order
-                sell_order = self._place_single_order(
-                    market=market,
-                    outcome=outcome,
-                    side=OrderSide.SELL,
-                    price=sell_price
-                )
-                if sell_order:
-                    placed_orders.append(sell_order)
-
-                time.sleep(0.5)
+                plan.append((outcome, OrderSide.BUY, buy_price))
+                plan.append((outcome, OrderSide.SELL, sell_price))
+
+            # Sign and post all orders concurrently; the rate limiter bounds the request rate
+            if plan:
+                with ThreadPoolExecutor(max_workers=min(MAX_PLACEMENT_WORKERS, len(plan))) as executor:
+                    futures = [
+                        executor.submit(self._place_single_order, market, outcome, side, price)
+                        for outcome, side, price in plan
+                    ]
+
+                    for (outcome, side, price), future in zip(plan, futures):
+                        try:
+                            order = future.result()
+                        except Exception as e:
+                            logger.error("Error placing %s order for %s: %s", side.value, outcome.outcome, e)
+                            order = self._record(
+                                market, outcome, side, price, 0, Config.ORDER_SIZE_USD,
+                                OrderStatus.FAILED,
+                                error=str(e)
+                            )
+                        if order:
+                            placed_orders.append(order)
 
             logger.info(
-                f"Placed {len(placed_orders)} orders for market {market.market_slug}"
+                "Placed %s orders for market %s",
+                len(placed_orders), market.market_slug
             )
 
             # VERIFY orders are actually in the orderbook
@@ -371,18 +484,18 @@ class OrderManager:
                 success_count = sum(1 for o in verified_orders if o.status == OrderStatus.PLACED)
                 failed_count = sum(1 for o in verified_orders if o.status == OrderStatus.FAILED)
 
-                logger.info(f"Order verification complete: {success_count} placed, {failed_count} failed")
+                logger.info("Order verification complete: %s placed, %s failed", success_count, failed_count)
                 for order in verified_orders:
                     status_symbol = "✓" if order.status == OrderStatus.PLACED else "✗"
                     logger.info(
-                        f"  {status_symbol} {order.side.value} {order.outcome} @ ${order.price:.2f} "
-                        f"x {order.size} shares - {order.status.value}"
+                        "  %s %s %s @ $%.2f x %s shares - %s",
+                        status_symbol, order.side.value, order.outcome, order.price, order.size, order.status.value
                     )
 
                 placed_orders = verified_orders
 
         except Exception as e:
-            logger.error(f"Error placing liquidity orders: {e}", exc_info=True)
+            logger.error("Error placing liquidity orders: %s", e, exc_info=True)
 
         return placed_orders
 
@@ -397,13 +510,52 @@ class OrderManager:
         Returns:
             Adjusted price
         """
-        # Clamp to valid range [0.01, 0.99]
-        price = max(0.01, min(0.99, price))
+        # Snap to the nearest tick in [0.01, 0.99]; only convert back at the API boundary
+        return price_to_tick(price) / TICKS_PER_DOLLAR
 
-        # Round to nearest 0.01 (tick size)
-        price = round(price, 2)
-
-        return price
+    def _record(
+        self,
+        market: Market,
+        outcome: Outcome,
+        side: OrderSide,
+        price: float,
+        size: float,
+        size_usd: float,
+        status: OrderStatus,
+        order_id: str = "FAILED",
+        error: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> OrderRecord:
+        """Build an order record with transaction fields derived from the order side."""
+        if side == OrderSide.BUY:
+            transaction_type = "BUY"
+            cost_usd = size_usd
+            revenue_usd = 0.0
+            pnl_usd = -size_usd
+        else:  # SELL
+            transaction_type = "SELL"
+            cost_usd = 0.0
+            revenue_usd = size_usd
+            pnl_usd = size_usd
+
+        return OrderRecord(
+            order_id=order_id,
+            market_slug=market.market_slug,
+            condition_id=market.condition_id,
+            token_id=outcome.token_id,
+            outcome=outcome.outcome,
+            side=side,
+            price=price,
+            size=size,
+            size_usd=size_usd,
+            status=status,
+            error_message=error,
+            strategy=strategy,
+            transaction_type=transaction_type,
+            cost_usd=cost_usd,
+            revenue_usd=revenue_usd,
+            pnl_usd=pnl_usd
+        )
 
     def _place_single_order_fixed(
         self,
@@ -417,14 +569,14 @@ class OrderManager:
         """Place a single limit order with fixed price and size."""
         try:
             if size <= 0:
-                logger.error(f"Invalid order size: {size}")
+                logger.error("Invalid order size: %s", size)
                 return None
 
             size_usd = price * size
 
             logger.info(
-                f"Placing {side.value} order: {outcome.outcome} @ ${price:.2f} "
-                f"for {size:.2f} shares (${size_usd:.2f})"
+                "Placing %s order: %s @ $%.2f for %.2f shares ($%.2f)",
+                side.value, outcome.outcome, price, size, size_usd
             )
 
             # Create order arguments (OrderArgs doesn't accept order_type, GTC is default)
@@ -432,13 +584,14 @@ class OrderManager:
                 token_id=outcome.token_id,
                 price=price,
                 size=size,
-                side=side.value
+                side=_SIDE_VALUE[side]
             )
 
             # Create and sign order
             signed_order = self.client.create_order(order_args)
 
             # Post order to Polymarket orderbook
+            self._limiter.acquire()
             post_response = self.client.post_order(signed_order)
 
             # Extract order ID from post response
@@ -452,72 +605,27 @@ class OrderManager:
                 order_id = str(signed_order.order.salt)
 
             if not order_id:
-                logger.error(f"No order ID in post response: {post_response}")
-                # Determine transaction fields for failed order
-                if side == OrderSide.BUY:
-                    transaction_type = "BUY"
-                    cost_usd = size_usd
-                    revenue_usd = 0.0
-                    pnl_usd = -size_usd
-                else:
-                    transaction_type = "SELL"
-                    cost_usd = 0.0
-                    revenue_usd = size_usd
-                    pnl_usd = size_usd
-
-                return OrderRecord(
-                    order_id="FAILED",
-                    market_slug=market.market_slug,
-                    condition_id=market.condition_id,
-                    token_id=outcome.token_id,
-                    outcome=outcome.outcome,
-                    side=side,
-                    price=price,
-                    size=size,
-                    size_usd=size_usd,
-                    status=OrderStatus.FAILED,
-                    error_message=f"No order ID in post response",
-                    strategy=strategy,
-                    transaction_type=transaction_type,
-                    cost_usd=cost_usd,
-                    revenue_usd=revenue_usd,
-                    pnl_usd=pnl_usd
+                logger.error("No order ID in post response: %s", post_response)
+                return self._record(
+                    market, outcome, side, price, size, size_usd, OrderStatus.FAILED,
+                    error="No order ID in post response",
+                    strategy=strategy
                 )
 
-            logger.info(f"Order posted successfully to orderbook: {order_id}")
+            logger.info("Order posted successfully to orderbook: %s", order_id)
 
-            # Determine transaction fields based on order side
             if side == OrderSide.BUY:
-                transaction_type = "BUY"
-                cost_usd = size_usd
-                revenue_usd = 0.0
-                pnl_usd = -size_usd
-            else:  # SELL
-                transaction_type = "SELL"
-                cost_usd = 0.0
-                revenue_usd = size_usd
-                pnl_usd = size_usd
-
-            return OrderRecord(
+                # BUY orders commit USDC; make the next balance read refetch
+                self._balance_cache = (0.0, 0.0)
+
+            return self._record(
+                market, outcome, side, price, size, size_usd, OrderStatus.PLACED,
                 order_id=order_id,
-                market_slug=market.market_slug,
-                condition_id=market.condition_id,
-                token_id=outcome.token_id,
-                outcome=outcome.outcome,
-                side=side,
-                price=price,
-                size=size,
-                size_usd=size_usd,
-                status=OrderStatus.PLACED,
-                strategy=strategy,
-                transaction_type=transaction_type,
-                cost_usd=cost_usd,
-                revenue_usd=revenue_usd,
-                pnl_usd=pnl_usd
+                strategy=strategy
             )
 
         except Exception as e:
-            logger.error(f"Error placing order: {e}", exc_info=True)
+            logger.error("Error placing order: %s", e, exc_info=True)
 
             # Check if this is a balance/allowance error
             error_str = str(e).lower()
@@ -526,77 +634,28 @@ class OrderManager:
             if is_balance_error:
                 logger.error("❌ INSUFFICIENT BALANCE OR ALLOWANCE - Cannot place orders!")
 
+            size_usd = price * size
+
             # Check if order was actually signed (may still be in orderbook despite API error)
-            order_id = None
             if 'signed_order' in locals() and hasattr(signed_order, 'order'):
                 if hasattr(signed_order.order, 'salt'):
                     order_id = str(signed_order.order.salt)
-                    logger.warning(f"API error but order was signed - may still be in orderbook: {order_id}")
+                    logger.warning("API error but order was signed - may still be in orderbook: %s", order_id)
 
                     # Return as potentially placed (verification will check orderbook)
-                    size_usd = price * size
-                    # Determine transaction fields based on order side
-                    if side == OrderSide.BUY:
-                        transaction_type = "BUY"
-                        cost_usd = size_usd
-                        revenue_usd = 0.0
-                        pnl_usd = -size_usd
-                    else:
-                        transaction_type = "SELL"
-                        cost_usd = 0.0
-                        revenue_usd = size_usd
-                        pnl_usd = size_usd
-
-                    return OrderRecord(
+                    return self._record(
+                        market, outcome, side, price, size, size_usd,
+                        OrderStatus.PLACED,  # Will be verified by verify_orders_in_orderbook()
                         order_id=order_id,
-                        market_slug=market.market_slug,
-                        condition_id=market.condition_id,
-                        token_id=outcome.token_id,
-                        outcome=outcome.outcome,
-                        side=side,
-                        price=price,
-                        size=size,
-                        size_usd=size_usd,
-                        status=OrderStatus.PLACED,  # Will be verified by verify_orders_in_orderbook()
-                        error_message=f"API error (will verify): {e}",
-                        strategy=strategy,
-                        transaction_type=transaction_type,
-                        cost_usd=cost_usd,
-                        revenue_usd=revenue_usd,
-                        pnl_usd=pnl_usd
+                        error=f"API error (will verify): {e}",
+                        strategy=strategy
                     )
 
             # If we couldn't get signed order, truly failed
-            size_usd = price * size
-            # Determine transaction fields for failed order
-            if side == OrderSide.BUY:
-                transaction_type = "BUY"
-                cost_usd = size_usd
-                revenue_usd = 0.0
-                pnl_usd = -size_usd
-            else:
-                transaction_type = "SELL"
-                cost_usd = 0.0
-                revenue_usd = size_usd
-                pnl_usd = size_usd
-
-            return OrderRecord(
-                order_id="FAILED",
-                market_slug=market.market_slug,
-                condition_id=market.condition_id,
-                token_id=outcome.token_id,
-                outcome=outcome.outcome,
-                side=side,
-                price=price,
-                size=0,
-                size_usd=size_usd,
-                status=OrderStatus.FAILED,
-                error_message=str(e),
-                strategy=strategy,
-                transaction_type=transaction_type,
-                cost_usd=cost_usd,
-                revenue_usd=revenue_usd,
-                pnl_usd=pnl_usd
+            return self._record(
+                market, outcome, side, price, 0, size_usd, OrderStatus.FAILED,
+                error=str(e),
+                strategy=strategy
             )
 
     def _place_single_order(
@@ -609,15 +668,15 @@ class OrderManager:
         """Place a single limit order."""
         try:
             # Calculate size
-            size = self.calculate_order_size(price, Config.ORDER_SIZE_USD)
+            size = self._size_hundredths(price_to_tick(price), Config.ORDER_SIZE_USD_CENTS) / 100
 
             if size <= 0:
-                logger.error(f"Invalid order size: {size}")
+                logger.error("Invalid order size: %s", size)
                 return None
 
             logger.info(
-                f"Placing {side.value} order: {outcome.outcome} @ ${price:.2f} "
-                f"for {size:.2f} shares (${Config.ORDER_SIZE_USD})"
+                "Placing %s order: %s @ $%.2f for %.2f shares ($%s)",
+                side.value, outcome.outcome, price, size, Config.ORDER_SIZE_USD
             )
 
             # Create order arguments (OrderArgs doesn't accept order_type, GTC is default)
@@ -625,13 +684,14 @@ class OrderManager:
                 token_id=outcome.token_id,
                 price=price,
                 size=size,
-                side=side.value
+                side=_SIDE_VALUE[side]
             )
 
             # Create and sign order
             signed_order = self.client.create_order(order_args)
 
             # Post order to Polymarket orderbook
+            self._limiter.acquire()
             post_response = self.client.post_order(signed_order)
 
             # Extract order ID from post response
@@ -645,98 +705,28 @@ class OrderManager:
                 order_id = str(signed_order.order.salt)
 
             if not order_id:
-                logger.error(f"No order ID in post response: {post_response}")
-                # Determine transaction fields for failed order
-                if side == OrderSide.BUY:
-                    transaction_type = "BUY"
-                    cost_usd = Config.ORDER_SIZE_USD
-                    revenue_usd = 0.0
-                    pnl_usd = -Config.ORDER_SIZE_USD
-                else:
-                    transaction_type = "SELL"
-                    cost_usd = 0.0
-                    revenue_usd = Config.ORDER_SIZE_USD
-                    pnl_usd = Config.ORDER_SIZE_USD
-
-                return OrderRecord(
-                    order_id="FAILED",
-                    market_slug=market.market_slug,
-                    condition_id=market.condition_id,
-                    token_id=outcome.token_id,
-                    outcome=outcome.outcome,
-                    side=side,
-                    price=price,
-                    size=size,
-                    size_usd=Config.ORDER_SIZE_USD,
-                    status=OrderStatus.FAILED,
-                    error_message=f"No order ID in post response",
-                    transaction_type=transaction_type,
-                    cost_usd=cost_usd,
-                    revenue_usd=revenue_usd,
-                    pnl_usd=pnl_usd
+                logger.error("No order ID in post response: %s", post_response)
+                return self._record(
+                    market, outcome, side, price, size, Config.ORDER_SIZE_USD, OrderStatus.FAILED,
+                    error="No order ID in post response"
                 )
 
-            logger.info(f"Order posted successfully to orderbook: {order_id}")
+            logger.info("Order posted successfully to orderbook: %s", order_id)
 
-            # Determine transaction fields based on order side
             if side == OrderSide.BUY:
-                transaction_type = "BUY"
-                cost_usd = Config.ORDER_SIZE_USD
-                revenue_usd = 0.0
-                pnl_usd = -Config.ORDER_SIZE_USD
-            else:
-                transaction_type = "SELL"
-                cost_usd = 0.0
-                revenue_usd = Config.ORDER_SIZE_USD
-                pnl_usd = Config.ORDER_SIZE_USD
+                # BUY orders commit USDC; make the next balance read refetch
+                self._balance_cache = (0.0, 0.0)
 
-            return OrderRecord(
-                order_id=order_id,
-                market_slug=market.market_slug,
-                condition_id=market.condition_id,
-                token_id=outcome.token_id,
-                outcome=outcome.outcome,
-                side=side,
-                price=price,
-                size=size,
-                size_usd=Config.ORDER_SIZE_USD,
-                status=OrderStatus.PLACED,
-                transaction_type=transaction_type,
-                cost_usd=cost_usd,
-                revenue_usd=revenue_usd,
-                pnl_usd=pnl_usd
+            return self._record(
+                market, outcome, side, price, size, Config.ORDER_SIZE_USD, OrderStatus.PLACED,
+                order_id=order_id
             )
 
         except Exception as e:
-            logger.error(f"Error placing order: {e}", exc_info=True)
-            # Determine transaction fields for failed order
-            if side == OrderSide.BUY:
-                transaction_type = "BUY"
-                cost_usd = Config.ORDER_SIZE_USD
-                revenue_usd = 0.0
-                pnl_usd = -Config.ORDER_SIZE_USD
-            else:
-                transaction_type = "SELL"
-                cost_usd = 0.0
-                revenue_usd = Config.ORDER_SIZE_USD
-                pnl_usd = Config.ORDER_SIZE_USD
-
-            return OrderRecord(
-                order_id="FAILED",
-                market_slug=market.market_slug,
-                condition_id=market.condition_id,
-                token_id=outcome.token_id,
-                outcome=outcome.outcome,
-                side=side,
-                price=price,
-                size=0,
-                size_usd=Config.ORDER_SIZE_USD,
-                status=OrderStatus.FAILED,
-                error_message=str(e),
-                transaction_type=transaction_type,
-                cost_usd=cost_usd,
-                revenue_usd=revenue_usd,
-                pnl_usd=pnl_usd
+            logger.error("Error placing order: %s", e, exc_info=True)
+            return self._record(
+                market, outcome, side, price, 0, Config.ORDER_SIZE_USD, OrderStatus.FAILED,
+                error=str(e)
             )
 
     def check_order_status(self, order: OrderRecord) -> OrderRecord:
@@ -754,48 +744,98 @@ class OrderManager:
             order_details = self.client.get_order(order.order_id)
 
             if not order_details:
-                logger.warning(f"Could not get details for order {order.order_id}")
+                logger.warning("Could not get details for order %s", order.order_id)
                 return order
 
-            # Check status
-            status = order_details.get("status", "").upper()
-            size_matched = float(order_details.get("size_matched", 0))
-            original_size = float(order_details.get("original_size", order.size))
-            order.size_matched = size_matched
+            self._apply_order_details(order, order_details)
 
-            if status == "MATCHED" or size_matched >= original_size:
-                order.status = OrderStatus.FILLED
-                if not order.filled_at:
-                    order.filled_at = datetime.now()
-                logger.info(f"Order {order.order_id} filled completely")
+        except Exception as e:
+            logger.error("Error checking order status for %s: %s", order.order_id, e)
 
-            elif size_matched > 0:
-                order.status = OrderStatus.PARTIALLY_FILLED
-                logger.info(
-                    f"Order {order.order_id} partially filled: "
-                    f"{size_matched}/{original_size}"
-                )
+        return order
 
-            elif status == "CANCELLED":
-                order.status = OrderStatus.CANCELLED
-                logger.info(f"Order {order.order_id} cancelled")
-            elif status in ["OPEN", "PLACED", "LIVE", "ACTIVE"]:
-                # Treat any open status as placed
-                if order.status != OrderStatus.PLACED:
-                    order.status = OrderStatus.PLACED
-                    logger.info(f"Order {order.order_id} still open")
+    def check_orders_status(self, orders: List[OrderRecord]) -> List[OrderRecord]:
+        """
+        Check and update the status of many orders with one open-orders fetch per market.
 
-            # Update realized cost/revenue when fills occur
-            if order.status in [OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED] and size_matched > 0:
-                if order.side == OrderSide.BUY:
-                    order.cost_usd = order.price * size_matched
-                elif order.side == OrderSide.SELL:
-                    order.revenue_usd = order.price * size_matched
+        Orders still resting in the book are resolved from the bulk response; only
+        orders that have left the book (filled or cancelled) are fetched individually.
 
-        except Exception as e:
-            logger.error(f"Error checking order status for {order.order_id}: {e}")
+        Args:
+            orders: Orders to check
 
-        return order
+        Returns:
+            The same order records, updated in place
+        """
+        if not orders:
+            return orders
+
+        from py_clob_client.client import OpenOrderParams
+
+        details_by_id: Dict[str, dict] = {}
+        for condition_id in {order.condition_id for order in orders}:
+            try:
+                active_orders = self.client.get_orders(OpenOrderParams(market=condition_id))
+                for details in active_orders:
+                    if details.get("id"):
+                        details_by_id[details["id"]] = details
+            except Exception as e:
+                logger.error("Error fetching open orders for %s: %s", condition_id, e)
+
+        for order in orders:
+            order_details = details_by_id.get(order.order_id)
+            if order_details is None:
+                self.check_order_status(order)
+                continue
+
+            try:
+                self._apply_order_details(order, order_details)
+            except Exception as e:
+                logger.error("Error checking order status for %s: %s", order.order_id, e)
+
+        return orders
+
+    def _apply_order_details(self, order: OrderRecord, order_details: dict):
+        """Update an order record in place from CLOB order details."""
+        try:
+            status, size_matched, original_size = _ORDER_DETAIL_FIELDS(order_details)
+        except KeyError:
+            status = order_details.get("status", "")
+            size_matched = order_details.get("size_matched", 0)
+            original_size = order_details.get("original_size", order.size)
+        status = status.upper()
+        size_matched = float(size_matched)
+        original_size = float(original_size)
+        order.size_matched = size_matched
+
+        if status == "MATCHED" or size_matched >= original_size:
+            order.status = OrderStatus.FILLED
+            if not order.filled_at:
+                order.filled_at = datetime.now()
+            logger.info("Order %s filled completely", order.order_id)
+
+        elif size_matched > 0:
+            order.status = OrderStatus.PARTIALLY_FILLED
+            logger.info(
+                "Order %s partially filled: %s/%s",
+                order.order_id, size_matched, original_size
+            )
+
+        elif status == "CANCELLED":
+            order.status = OrderStatus.CANCELLED
+            logger.info("Order %s cancelled", order.order_id)
+        elif status in ["OPEN", "PLACED", "LIVE", "ACTIVE"]:
+            # Treat any open status as placed
+            if order.status != OrderStatus.PLACED:
+                order.status = OrderStatus.PLACED
+                logger.info("Order %s still open", order.order_id)
+
+        # Update realized cost/revenue when fills occur
+        if order.status in [OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED] and size_matched > 0:
+            if order.side == OrderSide.BUY:
+                order.cost_usd = order.price * size_matched
+            elif order.side == OrderSide.SELL:
+                order.revenue_usd = order.price * size_matched
 
     def verify_orders_in_orderbook(self, market_slug: str, condition_id: str, placed_orders: List[OrderRecord]) -> List[OrderRecord]:
         """
@@ -810,7 +850,7 @@ class OrderManager:
             Updated list of OrderRecords with corrected statuses
         """
         try:
-            logger.info(f"Verifying orders for {market_slug} in orderbook...")
+            logger.info("Verifying orders for %s in orderbook...", market_slug)
 
             # Get all active orders for this market from the orderbook
             from py_clob_client.client import OpenOrderParams
@@ -819,7 +859,7 @@ class OrderManager:
             # Create a set of active order IDs for quick lookup
             active_order_ids = {order.get('id') for order in active_orders if order.get('id')}
 
-            logger.info(f"Found {len(active_orders)} active orders in orderbook for market")
+            logger.info("Found %s active orders in orderbook for market", len(active_orders))
 
             # Update order statuses based on what's actually in orderbook
             verified_orders = []
@@ -828,7 +868,7 @@ class OrderManager:
                     # Order is confirmed in orderbook
                     order.status = OrderStatus.PLACED
                     order.error_message = None
-                    logger.info(f"✓ Verified order {order.order_id[:16]}... in orderbook")
+                    logger.info("✓ Verified order %s... in orderbook", order.order_id[:16])
                 else:
                     # Order NOT in orderbook - mark as failed
                     order.status = OrderStatus.FAILED
@@ -840,14 +880,14 @@ class OrderManager:
                     order.pnl_usd = 0.0
                     if not order.error_message:
                         order.error_message = "Order not found in orderbook after placement"
-                    logger.warning(f"✗ Order {order.order_id[:16]}... NOT in orderbook - marking as FAILED")
+                    logger.warning("✗ Order %s... NOT in orderbook - marking as FAILED", order.order_id[:16])
 
                 verified_orders.append(order)
 
             return verified_orders
 
         except Exception as e:
-            logger.error(f"Error verifying orders in orderbook: {e}", exc_info=True)
+            logger.error("Error verifying orders in orderbook: %s", e, exc_info=True)
             # On error, return orders as-is (don't change their status)
             return placed_orders
 
@@ -862,12 +902,13 @@ class OrderManager:
             True if successful
         """
         try:
-            logger.info(f"Cancelling order {order_id}")
+            logger.info("Cancelling order %s", order_id)
+            self._limiter.acquire()
             response = self.client.cancel(order_id)
-            logger.info(f"Order cancelled: {order_id}")
+            logger.info("Order cancelled: %s", order_id)
             return True
         except Exception as e:
-            logger.error(f"Error cancelling order {order_id}: {e}")
+            logger.error("Error cancelling order %s: %s", order_id, e)
             return False
 
     def cancel_orders(self, orders: List[OrderRecord]) -> int:
@@ -880,14 +921,38 @@ class OrderManager:
         Returns:
             Number of successfully cancelled orders
         """
+        cancellable = [
+            order for order in orders
+            if order.status in [OrderStatus.PLACED, OrderStatus.PARTIALLY_FILLED]
+        ]
+        if not cancellable:
+            return 0
+
+        # Cancel everything in a single batch request instead of one call per order
+        order_ids = [order.order_id for order in cancellable]
+        try:
+            logger.info("Cancelling %s orders", len(order_ids))
+            self._limiter.acquire()
+            response = self.client.cancel_orders(order_ids)
+        except Exception as e:
+            logger.error("Error cancelling orders %s: %s", order_ids, e)
+            return 0
+
+        cancelled = set(response.get("canceled", [])) if isinstance(response, dict) else set()
+        not_cancelled = response.get("not_canceled", {}) if isinstance(response, dict) else {}
+
         cancelled_count = 0
-        for order in orders:
-            if order.status in [OrderStatus.PLACED, OrderStatus.PARTIALLY_FILLED]:
-                if self.cancel_order(order.order_id):
-                    cancelled_count += 1
-                    order.status = OrderStatus.CANCELLED
-                time.sleep(0.3)  # Rate limiting
+        for order in cancellable:
+            if order.order_id in cancelled:
+                order.status = OrderStatus.CANCELLED
+                cancelled_count += 1
+            elif order.order_id in not_cancelled:
+                logger.warning(
+                    "Order %s not cancelled: %s",
+                    order.order_id, not_cancelled[order.order_id]
+                )
 
+        logger.info("Cancelled %s/%s orders", cancelled_count, len(order_ids))
         return cancelled_count
 
     def get_positions(self, token_ids: List[str]) -> Dict[str, float]:
@@ -908,7 +973,7 @@ class OrderManager:
             logger.warning("Position checking not fully implemented yet")
             return positions
         except Exception as e:
-            logger.error(f"Error getting positions: {e}")
+            logger.error("Error getting positions: %s", e)
             return positions
 
     def sell_position_market(
@@ -930,7 +995,7 @@ class OrderManager:
         """
         try:
             if size <= 0:
-                logger.warning(f"Cannot sell size {size}")
+                logger.warning("Cannot sell size %s", size)
                 return None
 
             # Get current best bid (we'll sell below this price to get filled immediately)
@@ -944,19 +1009,19 @@ class OrderManager:
                     break
 
             if not target_outcome or not target_outcome.best_bid:
-                logger.error(f"No best bid available for {outcome.outcome}")
+                logger.error("No best bid available for %s", outcome.outcome)
                 return None
 
             # If no best bid or too low, skip selling to avoid dumping at terrible prices
             best_bid = target_outcome.best_bid
             if not best_bid or best_bid <= 0:
-                logger.error(f"No best bid available for {outcome.outcome}")
+                logger.error("No best bid available for %s", outcome.outcome)
                 return None
 
             if best_bid < Config.MIN_SELL_PRICE:
                 logger.warning(
-                    f"Best bid {best_bid:.4f} is below MIN_SELL_PRICE {Config.MIN_SELL_PRICE:.2f} "
-                    f"for {outcome.outcome}; skipping market sell"
+                    "Best bid %.4f is below MIN_SELL_PRICE %.2f for %s; skipping market sell",
+                    best_bid, Config.MIN_SELL_PRICE, outcome.outcome
                 )
                 return None
 
@@ -964,8 +1029,8 @@ class OrderManager:
             sell_price = self._adjust_price(best_bid - Config.MARKET_SELL_DISCOUNT, is_buy=False)
 
             logger.info(
-                f"Selling position: {outcome.outcome} @ ${sell_price:.2f} "
-                f"for {size:.2f} shares (market order)"
+                "Selling position: %s @ $%.2f for %.2f shares (market order)",
+                outcome.outcome, sell_price, size
             )
 
             # Create sell order (OrderArgs doesn't accept order_type, GTC is default)
@@ -973,13 +1038,14 @@ class OrderManager:
                 token_id=outcome.token_id,
                 price=sell_price,
                 size=size,
-                side=OrderSide.SELL.value
+                side=_SIDE_VALUE[OrderSide.SELL]
             )
 
             # Create and sign order
             signed_order = self.client.create_order(order_args)
 
             # Post order to Polymarket orderbook
+            self._limiter.acquire()
             post_response = self.client.post_order(signed_order)
 
             # Extract order ID from post response
@@ -993,31 +1059,19 @@ class OrderManager:
                 order_id = str(signed_order.order.salt)
 
             if not order_id:
-                logger.error(f"No order ID in post response: {post_response}")
+                logger.error("No order ID in post response: %s", post_response)
                 return None
 
-            logger.info(f"Market sell order posted to orderbook: {order_id}")
+            logger.info("Market sell order posted to orderbook: %s", order_id)
 
-            size_usd = sell_price * size
-            return OrderRecord(
-                order_id=order_id,
-                market_slug=market.market_slug,
-                condition_id=market.condition_id,
-                token_id=outcome.token_id,
-                outcome=outcome.outcome,
-                side=OrderSide.SELL,
-                price=sell_price,
-                size=size,
-                size_usd=size_usd,
-                status=OrderStatus.PLACED,
-                transaction_type="SELL",
-                cost_usd=0.0,
-                revenue_usd=size_usd,
-                pnl_usd=size_usd
+            return self._record(
+                market, outcome, OrderSide.SELL, sell_price, size, sell_price * size,
+                OrderStatus.PLACED,
+                order_id=order_id
             )
 
         except Exception as e:
-            logger.error(f"Error selling position: {e}", exc_info=True)
+            logger.error("Error selling position: %s", e, exc_info=True)
             return None
 
     def _get_token_balances(self, token_ids: list[str]) -> dict[str, float]:
@@ -1032,7 +1086,7 @@ class OrderManager:
         """
         from web3 import Web3
 
-        w3 = Web3(Web3.HTTPProvider(Config.RPC_URL))
+        w3 = self._get_web3()
         if not w3.is_connected():
             logger.warning("Cannot connect to RPC to check balances")
             return {}
@@ -1064,7 +1118,7 @@ class OrderManager:
                 balance_wei = ctf.functions.balanceOf(wallet, int(token_id)).call()
                 balances[token_id] = balance_wei / 1_000_000  # 6 decimals
             except Exception as e:
-                logger.warning(f"Could not check balance for token {token_id}: {e}")
+                logger.warning("Could not check balance for token %s: %s", token_id, e)
                 balances[token_id] = 0.0
 
         return balances
@@ -1101,7 +1155,7 @@ class OrderManager:
 
                         # Check if API returned None (old/expired order data)
                         if not order_details:
-                            logger.debug(f"No API data for order {order.order_id} - may be expired")
+                            logger.debug("No API data for order %s - may be expired", order.order_id)
                             continue
 
                         size_matched = float(order_details.get("size_matched", 0))
@@ -1113,7 +1167,7 @@ class OrderManager:
                             elif outcome_upper in ["NO", "DOWN"]:
                                 filled_by_outcome["NO"] += size_matched
                     except Exception as e:
-                        logger.warning(f"Could not get filled size for order {order.order_id}: {e}")
+                        logger.warning("Could not get filled size for order %s: %s", order.order_id, e)
 
             # Check if we have both YES and NO positions
             yes_amount = filled_by_outcome.get("YES", 0.0)
@@ -1143,7 +1197,7 @@ class OrderManager:
 
             if not yes_token_id or not no_token_id:
                 # Downgrade to debug - this is expected for old orphaned orders
-                logger.debug(f"Cannot merge - missing token IDs for {market.market_slug}")
+                logger.debug("Cannot merge - missing token IDs for %s", market.market_slug)
                 return 0.0
 
             # Check actual on-chain balances
@@ -1152,9 +1206,8 @@ class OrderManager:
             actual_no = actual_balances.get(no_token_id, 0.0)
 
             logger.info(
-                f"Position check for {market.market_slug}: "
-                f"API says YES={yes_amount}, NO={no_amount} | "
-                f"Wallet has YES={actual_yes}, NO={actual_no}"
+                "Position check for %s: API says YES=%s, NO=%s | Wallet has YES=%s, NO=%s",
+                market.market_slug, yes_amount, no_amount, actual_yes, actual_no
             )
 
             # Use wallet balance as source of truth
@@ -1163,7 +1216,7 @@ class OrderManager:
             no_amount = actual_no
 
             if yes_amount <= 0 or no_amount <= 0:
-                logger.info(f"No actual tokens to merge for {market.market_slug}")
+                logger.info("No actual tokens to merge for %s", market.market_slug)
                 return 0.0
 
             # Merge the maximum equal sets (partial merge if imbalanced)
@@ -1172,18 +1225,18 @@ class OrderManager:
             merge_amount = max(0.0, mergeable_amount - already_merged_amount)
 
             if merge_amount <= MERGE_TOLERANCE:
-                logger.info(f"No new mergeable positions for {market.market_slug}")
+                logger.info("No new mergeable positions for %s", market.market_slug)
                 return 0.0
 
             if abs(yes_amount - no_amount) > MERGE_TOLERANCE:
                 logger.info(
-                    f"Partial merge available for {market.market_slug}: "
-                    f"YES={yes_amount}, NO={no_amount}, merging={merge_amount}"
+                    "Partial merge available for %s: YES=%s, NO=%s, merging=%s",
+                    market.market_slug, yes_amount, no_amount, merge_amount
                 )
             else:
                 logger.info(
-                    f"Found {merge_amount} mergeable sets for {market.market_slug} "
-                    f"(YES={yes_amount}, NO={no_amount})"
+                    "Found %s mergeable sets for %s (YES=%s, NO=%s)",
+                    merge_amount, market.market_slug, yes_amount, no_amount
                 )
 
             # Merge the positions
@@ -1191,12 +1244,12 @@ class OrderManager:
             tx_hash = merger.merge_positions(market.condition_id, merge_amount)
 
             if tx_hash:
-                logger.info(f"Merged {merge_amount} sets -> {merge_amount} USDC")
+                logger.info("Merged %s sets -> %s USDC", merge_amount, merge_amount)
                 return merge_amount
             else:
                 logger.error("Merge failed")
                 return 0.0
 
         except Exception as e:
-            logger.error(f"Error in merge_positions_if_possible: {e}", exc_info=True)
+            logger.error("Error in merge_positions_if_possible: %s", e, exc_info=True)
             return 0.0
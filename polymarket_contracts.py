@@ -0,0 +1,168 @@
+"""Shared Polymarket contract addresses, ABIs and precomputed calldata helpers on Polygon."""
+
+from eth_abi import encode
+from web3 import Web3
+
+# Contract addresses on Polygon (checksummed once at import)
+USDC_ADDRESS = Web3.to_checksum_address("0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174")
+CTF_ADDRESS = Web3.to_checksum_address("0x4D97DCd97eC945f40cF65F87097ACe5EA0476045")  # Conditional Tokens
+MULTICALL3_ADDRESS = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")  # Same on every EVM chain
+
+# Spender addresses (all three exchanges)
+SPENDERS = [
+    (Web3.to_checksum_address(address), name)
+    for address, name in [
+        ("0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E", "CTF Exchange"),
+        ("0xC5d563A36AE78145C45a50134d48A1215220f80a", "Neg Risk CTF Exchange"),
+        ("0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296", "Neg Risk Adapter")
+    ]
+]
+
+# ERC20 approve/allowance ABI
+USDC_ABI = [
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "_spender", "type": "address"},
+            {"name": "_value", "type": "uint256"}
+        ],
+        "name": "approve",
+        "outputs": [{"name": "", "type": "bool"}],
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "_owner", "type": "address"},
+            {"name": "_spender", "type": "address"}
+        ],
+        "name": "allowance",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "type": "function"
+    }
+]
+
+# ERC1155 setApprovalForAll/isApprovedForAll ABI
+CTF_ABI = [
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "operator", "type": "address"},
+            {"name": "approved", "type": "bool"}
+        ],
+        "name": "setApprovalForAll",
+        "outputs": [],
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "account", "type": "address"},
+            {"name": "operator", "type": "address"}
+        ],
+        "name": "isApprovedForAll",
+        "outputs": [{"name": "", "type": "bool"}],
+        "type": "function"
+    }
+]
+
+# CTF redeemPositions ABI
+REDEEM_ABI = [{
+    "constant": False,
+    "inputs": [
+        {"name": "collateralToken", "type": "address"},
+        {"name": "parentCollectionId", "type": "bytes32"},
+        {"name": "conditionId", "type": "bytes32"},
+        {"name": "indexSets", "type": "uint256[]"}
+    ],
+    "name": "redeemPositions",
+    "outputs": [],
+    "type": "function"
+}]
+
+# Read-only CTF view used to check balances before redeeming
+CTF_VIEW_ABI = [{
+    "constant": True,
+    "inputs": [
+        {"name": "owners", "type": "address[]"},
+        {"name": "ids", "type": "uint256[]"}
+    ],
+    "name": "balanceOfBatch",
+    "outputs": [{"name": "", "type": "uint256[]"}],
+    "type": "function"
+}]
+
+# Redemption parameters for Polymarket binary markets
+PARENT_COLLECTION_ID = b'\x00' * 32  # Null for Polymarket
+INDEX_SETS = [1, 2]  # Binary market: both outcomes
+
+# Multicall3 aggregate3 ABI
+MULTICALL3_ABI = [{
+    "inputs": [{
+        "components": [
+            {"name": "target", "type": "address"},
+            {"name": "allowFailure", "type": "bool"},
+            {"name": "callData", "type": "bytes"}
+        ],
+        "name": "calls",
+        "type": "tuple[]"
+    }],
+    "name": "aggregate3",
+    "outputs": [{
+        "components": [
+            {"name": "success", "type": "bool"},
+            {"name": "returnData", "type": "bytes"}
+        ],
+        "name": "returnData",
+        "type": "tuple[]"
+    }],
+    "stateMutability": "payable",
+    "type": "function"
+}]
+
+# Function selectors for the approval and redemption transactions, hashed once at import
+APPROVE_SELECTOR = bytes(Web3.keccak(text="approve(address,uint256)")[:4])
+SET_APPROVAL_FOR_ALL_SELECTOR = bytes(Web3.keccak(text="setApprovalForAll(address,bool)")[:4])
+REDEEM_SELECTOR = bytes(Web3.keccak(text="redeemPositions(address,bytes32,bytes32,uint256[])")[:4])
+
+# Only the conditionId word varies between redemptions: encode once and split
+# around it (selector + collateral + parent | conditionId | indexSets offset + tail)
+_REDEEM_TEMPLATE = (REDEEM_SELECTOR + encode(
+    ["address", "bytes32", "bytes32", "uint256[]"],
+    [USDC_ADDRESS, PARENT_COLLECTION_ID, b"\x00" * 32, INDEX_SETS]
+)).hex()
+REDEEM_CALLDATA_PREFIX = "0x" + _REDEEM_TEMPLATE[:2 * (4 + 64)]
+REDEEM_CALLDATA_SUFFIX = _REDEEM_TEMPLATE[2 * (4 + 96):]
+
+# Gas limit for redeemPositions on a binary market (uses ~120k-180k)
+REDEEM_GAS_LIMIT = 250_000
+
+
+def usdc(w3: Web3):
+    """Get the USDC contract bound to a Web3 instance."""
+    return w3.eth.contract(address=USDC_ADDRESS, abi=USDC_ABI)
+
+
+def ctf(w3: Web3):
+    """Get the CTF contract bound to a Web3 instance."""
+    return w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI)
+
+
+def multicall(w3: Web3):
+    """Get the Multicall3 contract bound to a Web3 instance."""
+    return w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+
+def encode_approve(spender: str, amount: int) -> str:
+    """Build ERC20 approve(spender, amount) calldata without a contract proxy."""
+    return "0x" + (APPROVE_SELECTOR + encode(["address", "uint256"], [spender, amount])).hex()
+
+
+def encode_set_approval_for_all(operator: str, approved: bool) -> str:
+    """Build ERC1155 setApprovalForAll(operator, approved) calldata without a contract proxy."""
+    return "0x" + (SET_APPROVAL_FOR_ALL_SELECTOR + encode(["address", "bool"], [operator, approved])).hex()
+
+
+def encode_redeem(condition_id: str) -> str:
+    """Build redeemPositions calldata for both outcomes of a condition (0x-prefixed hex ID)."""
+    return REDEEM_CALLDATA_PREFIX + condition_id[2:].lower() + REDEEM_CALLDATA_SUFFIX
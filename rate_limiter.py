@@ -0,0 +1,55 @@
+"""Token-bucket rate limiter for pacing CLOB API requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing bursts up to capacity, refilled at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to rate, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens accrued since the last refill."""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        Take tokens from the bucket, blocking only while the budget is exhausted.
+
+        Args:
+            tokens: Number of tokens to consume
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
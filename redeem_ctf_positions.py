@@ -1,49 +1,40 @@
 """Redeem CTF positions after market resolution."""
-from web3 import Web3
-from config import Config
+import argparse
+from confirmation_manager import wait_for_receipt
 from logger import logger
+from polymarket_contracts import CTF_ADDRESS, INDEX_SETS, REDEEM_GAS_LIMIT, USDC_ADDRESS, encode_redeem
+from redemption_core import get_account, get_position_balances, get_w3
+from rpc_config import fees_from_history
+
+parser = argparse.ArgumentParser(description="Redeem CTF positions for a resolved market")
+parser.add_argument(
+    "--market-slug",
+    default="btc-updown-15m-1766141100",
+    help="Slug of the resolved market to redeem"
+)
+parser.add_argument(
+    "--yes",
+    action="store_true",
+    help="Skip the confirmation prompt"
+)
+args = parser.parse_args()
 
 print('='*60)
 print('Redeem CTF Positions')
 print('='*60)
 
-RPC_URL = Config.RPC_URL
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
+w3 = get_w3()
 
 if not w3.is_connected():
     print("ERROR: Cannot connect to Polygon")
     exit(1)
 
 # Get wallet
-private_key = Config.PRIVATE_KEY
-account = w3.eth.account.from_key(private_key)
+account = get_account()
 wallet = account.address
 
 print(f'Wallet: {wallet}\n')
 
-# Contract addresses
-CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-
-# redeemPositions ABI
-REDEEM_ABI = [{
-    "constant": False,
-    "inputs": [
-        {"name": "collateralToken", "type": "address"},
-        {"name": "parentCollectionId", "type": "bytes32"},
-        {"name": "conditionId", "type": "bytes32"},
-        {"name": "indexSets", "type": "uint256[]"}
-    ],
-    "name": "redeemPositions",
-    "outputs": [],
-    "type": "function"
-}]
-
-ctf = w3.eth.contract(
-    address=Web3.to_checksum_address(CTF_ADDRESS),
-    abi=REDEEM_ABI
-)
-
 # We need to get the conditionId from the market
 # The market that just resolved was: btc-updown-15m-1766141100
 
@@ -54,27 +45,15 @@ print('To redeem your positions, we need:')
 print('1. conditionId - from the resolved market')
 print('2. indexSets - typically [1, 2] for binary markets\n')
 
-# Let's try to get this from the order manager
-from order_manager import OrderManager
-from market_discovery import MarketDiscovery
+from market_cache import get_market_by_slug
 
 try:
-    om = OrderManager(Config.PRIVATE_KEY)
-    disc = MarketDiscovery()
-
     print('Checking recent markets...\n')
 
-    # Get all BTC markets
-    markets = disc.discover_btc_15m_markets()
+    # Look for the market that recently resolved (btc-updown-15m-1766141100 by default)
+    target_market_slug = args.market_slug
 
-    # Look for the market that recently resolved (btc-updown-15m-1766141100)
-    target_market_slug = "btc-updown-15m-1766141100"
-
-    market = None
-    for m in markets:
-        if m.market_slug == target_market_slug:
-            market = m
-            break
+    market = get_market_by_slug(target_market_slug)
 
     if market:
         print(f'Found market: {market.market_slug}')
@@ -82,17 +61,17 @@ try:
         print(f'Question: {market.question}')
         print()
 
-        # Prepare redemption parameters
-        collateral_token = Web3.to_checksum_address(USDC_ADDRESS)
-        parent_collection_id = b'\x00' * 32  # Null bytes for Polymarket
-        condition_id = bytes.fromhex(market.condition_id[2:])  # Remove '0x' prefix
-        index_sets = [1, 2]  # Binary market: both outcomes
+        # Skip the whole send-and-wait path if there is nothing to redeem
+        position_ids = [int(outcome.token_id) for outcome in market.outcomes]
+        if position_ids and not any(get_position_balances(wallet, position_ids)):
+            print('No tokens held for this market - already redeemed or never held.')
+            exit(0)
 
         print('Redemption parameters:')
-        print(f'  Collateral: {collateral_token}')
+        print(f'  Collateral: {USDC_ADDRESS}')
         print(f'  Parent Collection: 0x{"00" * 32}')
         print(f'  Condition ID: {market.condition_id}')
-        print(f'  Index Sets: {index_sets}')
+        print(f'  Index Sets: {INDEX_SETS}')
         print()
 
         # Confirm before executing
@@ -100,35 +79,33 @@ try:
         print('This will burn your CTF tokens and return USDC.')
         print()
 
-        response = input('Proceed with redemption? (yes/no): ')
-
-        if response.lower() != 'yes':
+        if not args.yes and input('Proceed with redemption? (yes/no): ').lower() != 'yes':
             print('Redemption cancelled.')
             exit(0)
 
         print('\nBuilding redemption transaction...')
 
-        # Get current nonce and gas price
+        # Get current nonce and EIP-1559 fees
         nonce = w3.eth.get_transaction_count(wallet)
-        gas_price = w3.eth.gas_price
-
-        # Build transaction
-        redeem_txn = ctf.functions.redeemPositions(
-            collateral_token,
-            parent_collection_id,
-            condition_id,
-            index_sets
-        ).build_transaction({
+        max_fee, priority_fee = fees_from_history(w3.eth.fee_history(4, 'latest', [50]))
+
+        # Build transaction from the shared precomputed calldata
+        redeem_txn = {
             'from': wallet,
+            'to': CTF_ADDRESS,
+            'data': encode_redeem(market.condition_id),
+            'value': 0,
             'nonce': nonce,
-            'gas': 300000,  # Estimated gas
-            'gasPrice': gas_price,
+            'gas': REDEEM_GAS_LIMIT,
+            'maxFeePerGas': max_fee,
+            'maxPriorityFeePerGas': priority_fee,
+            'type': 2,
             'chainId': 137
-        })
+        }
 
         print(f'  Nonce: {nonce}')
-        print(f'  Gas Price: {w3.from_wei(gas_price, "gwei")} gwei')
-        print(f'  Gas Limit: 300000')
+        print(f'  Max Fee: {w3.from_wei(max_fee, "gwei")} gwei (priority {w3.from_wei(priority_fee, "gwei")} gwei)')
+        print(f'  Gas Limit: {REDEEM_GAS_LIMIT}')
 
         # Estimate actual gas
         try:
@@ -139,7 +116,7 @@ try:
             print(f'  Could not estimate gas: {e}')
 
         print('\nSigning transaction...')
-        signed_txn = w3.eth.account.sign_transaction(redeem_txn, private_key)
+        signed_txn = account.sign_transaction(redeem_txn)
 
         print('Sending transaction...')
         tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
@@ -149,7 +126,7 @@ try:
         print(f'PolygonScan: https://polygonscan.com/tx/{tx_hash.hex()}')
 
         print('\nWaiting for confirmation...')
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        receipt = wait_for_receipt(tx_hash, timeout=120)
 
         if receipt.status == 1:
             print('\n' + '='*60)
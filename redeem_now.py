@@ -1,17 +1,13 @@
 """Redeem positions using token IDs from PolygonScan."""
-from web3 import Web3
 from config import Config
+from redemption_core import get_account
 
 print('='*60)
 print('Redeem Positions from Token IDs')
 print('='*60)
 
-RPC_URL = Config.RPC_URL
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
-
 # Get wallet
-private_key = Config.PRIVATE_KEY
-account = w3.eth.account.from_key(private_key)
+account = get_account()
 wallet = account.address
 
 print(f'Wallet: {wallet}\n')
@@ -29,26 +25,22 @@ TOKEN_ID_1 = 3142259449643408630329216119529194178382553635829890652934649791452
 # We need to work backwards or get the condition ID from the market
 # The easiest way is to check recent BTC markets
 
-from market_discovery import MarketDiscovery
+from market_cache import get_market_by_slug
 
 print('Searching for recent BTC markets to find condition ID...\n')
 
-disc = MarketDiscovery()
-markets = disc.discover_btc_15m_markets()
-
-# Look for markets around the time of your orders (timestamp 1766141100 or 1766142000)
+# Look for markets around the time of your orders (slug/start timestamp 1766141100 or 1766142000)
 TARGET_TIMESTAMPS = [1766141100, 1766142000]
 
 found_markets = []
-for market in markets:
-    # Markets have end_date_iso which we can parse
-    if hasattr(market, 'end_time'):
-        if market.end_time in TARGET_TIMESTAMPS:
-            found_markets.append(market)
-            print(f'Found market: {market.market_slug}')
-            print(f'  Condition ID: {market.condition_id}')
-            print(f'  End time: {market.end_time}')
-            print()
+for timestamp in TARGET_TIMESTAMPS:
+    market = get_market_by_slug(f'btc-updown-15m-{timestamp}')
+    if market:
+        found_markets.append(market)
+        print(f'Found market: {market.market_slug}')
+        print(f'  Condition ID: {market.condition_id}')
+        print(f'  End time: {market.end_timestamp}')
+        print()
 
 if not found_markets:
     print('Could not find the exact market in current API results.')
@@ -1,192 +1,300 @@
 """Redeem all redeemable positions using Polymarket Positions API."""
-from web3 import Web3
+import argparse
+import asyncio
+import sys
+import aiohttp
+from web3 import AsyncWeb3, AsyncHTTPProvider
 from config import Config
+from confirmation_manager import ConfirmationManager
+from rpc_config import fees_from_history
+from polymarket_contracts import CTF_ADDRESS, REDEEM_GAS_LIMIT, encode_redeem
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-print('='*60)
-print('Polymarket Position Redemption')
-print('='*60)
-
-# Initialize Web3
-RPC_URL = Config.RPC_URL
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
-
-if not w3.is_connected():
-    print("ERROR: Cannot connect to Polygon")
-    exit(1)
-
-# Get wallet
-private_key = Config.PRIVATE_KEY
-account = w3.eth.account.from_key(private_key)
-wallet = account.address
-
-print(f'Wallet: {wallet}\n')
-
-# Fetch positions from Polymarket API
-print('Fetching positions from Polymarket API...')
-api_url = f"https://data-api.polymarket.com/positions?user={wallet}"
-response = requests.get(api_url)
-
-if response.status_code != 200:
-    print(f'ERROR: Failed to fetch positions (status {response.status_code})')
-    exit(1)
-
-positions = response.json()
-
-if not positions:
-    print('No positions found.')
-    exit(0)
-
-print(f'Found {len(positions)} position(s)\n')
-
-# Filter redeemable positions
-redeemable = [p for p in positions if p.get('redeemable', False)]
-
-if not redeemable:
-    print('No redeemable positions found.')
-    print('All positions have been redeemed or markets are not yet resolved.')
-    exit(0)
-
-print(f'Found {len(redeemable)} redeemable position(s):\n')
-
-# Group by condition ID
-by_condition = {}
-for pos in redeemable:
-    cid = pos['conditionId']
-    if cid not in by_condition:
-        by_condition[cid] = []
-    by_condition[cid].append(pos)
-
-# Display summary
-total_value = 0
-for cid, positions in by_condition.items():
-    market_title = positions[0]['title']
-    market_slug = positions[0]['slug']
-    market_value = sum(p['currentValue'] for p in positions)
-    total_value += market_value
-
-    print(f'Market: {market_title}')
-    print(f'  Slug: {market_slug}')
-    print(f'  Condition ID: {cid}')
-    print(f'  Positions: {len(positions)}')
-    print(f'  Total Value: ${market_value:.2f}')
-    for p in positions:
-        print(f'    - {p["outcome"]}: {p["size"]} shares @ ${p["curPrice"]:.2f} = ${p["currentValue"]:.2f}')
-    print()
+# Max redemptions in flight at once (public RPCs throttle bursts)
+MAX_CONCURRENT_REDEMPTIONS = 8
 
-print(f'TOTAL REDEEMABLE VALUE: ${total_value:.2f}\n')
-
-# Ask for confirmation
-response = input(f'Redeem all positions? This will burn CTF tokens and return ${total_value:.2f} USDC to your wallet. (yes/no): ').strip().lower()
-
-if response != 'yes':
-    print('Redemption cancelled.')
-    exit(0)
-
-# Contract setup
-CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-
-REDEEM_ABI = [{
-    "constant": False,
-    "inputs": [
-        {"name": "collateralToken", "type": "address"},
-        {"name": "parentCollectionId", "type": "bytes32"},
-        {"name": "conditionId", "type": "bytes32"},
-        {"name": "indexSets", "type": "uint256[]"}
-    ],
-    "name": "redeemPositions",
-    "outputs": [],
-    "type": "function"
-}]
-
-ctf = w3.eth.contract(
-    address=Web3.to_checksum_address(CTF_ADDRESS),
-    abi=REDEEM_ABI
-)
-
-# Redeem each market
-print('\n' + '='*60)
-print('Starting Redemption')
-print('='*60 + '\n')
-
-success_count = 0
-fail_count = 0
-
-for cid, positions in by_condition.items():
-    market_title = positions[0]['title']
-    print(f'Redeeming: {market_title}')
-    print(f'  Condition ID: {cid}')
-
-    # Prepare redemption parameters
-    collateral_token = Web3.to_checksum_address(USDC_ADDRESS)
-    parent_collection_id = b'\x00' * 32  # Null for Polymarket
-    condition_id_bytes = bytes.fromhex(cid[2:])  # Remove '0x'
-    index_sets = [1, 2]  # Binary market: both outcomes
+# Seconds between cycles in --daemon mode (markets resolve every 15 minutes)
+DAEMON_INTERVAL_SECONDS = 900
 
-    try:
-        # Build transaction
-        nonce = w3.eth.get_transaction_count(wallet)
-        gas_price = w3.eth.gas_price
-
-        redeem_txn = ctf.functions.redeemPositions(
-            collateral_token,
-            parent_collection_id,
-            condition_id_bytes,
-            index_sets
-        ).build_transaction({
-            'from': wallet,
-            'nonce': nonce,
-            'gas': 300000,
-            'gasPrice': gas_price,
-            'chainId': 137
-        })
-
-        # Estimate gas
+# Keep-alive session for Polymarket API calls
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.1)
+))
+
+
+async def redeem_one(w3, account, market_title, redeem_txn, send_lock, next_nonce, semaphore, confirmations):
+    """Sign, send and confirm one prepared redemption transaction."""
+    async with semaphore:
         try:
-            estimated_gas = w3.eth.estimate_gas(redeem_txn)
-            redeem_txn['gas'] = int(estimated_gas * 1.2)
-            print(f'  Estimated Gas: {estimated_gas}')
+            # Assign nonces at send time so a failed send never leaves a nonce gap
+            async with send_lock:
+                redeem_txn['nonce'] = next_nonce[0]
+                signed_txn = account.sign_transaction(redeem_txn)
+                tx_hash = await w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+                next_nonce[0] += 1
+
+            print(f'  [{market_title}] Transaction sent: {tx_hash.hex()}')
+            print(f'  [{market_title}] PolygonScan: https://polygonscan.com/tx/{tx_hash.hex()}')
+
+            receipt = await confirmations.wait(tx_hash, timeout=120)
+
+            if receipt.status == 1:
+                print(f'  [SUCCESS] Redeemed: {market_title} (Gas Used: {receipt.gasUsed})')
+                return True
+
+            print(f'  [FAILED] Transaction reverted: {market_title}')
+            return False
+
         except Exception as e:
-            print(f'  Could not estimate gas: {e}')
-            print(f'  Using default: 300000')
-
-        # Sign and send
-        print('  Signing and sending transaction...')
-        signed_txn = w3.eth.account.sign_transaction(redeem_txn, private_key)
-        tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-
-        print(f'  [OK] Transaction sent!')
-        print(f'  TX Hash: {tx_hash.hex()}')
-        print(f'  PolygonScan: https://polygonscan.com/tx/{tx_hash.hex()}')
-
-        # Wait for confirmation
-        print('  Waiting for confirmation...')
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-
-        if receipt.status == 1:
-            print(f'  [SUCCESS] Redeemed!')
-            print(f'  Gas Used: {receipt.gasUsed}')
-            success_count += 1
+            print(f'  [ERROR] {market_title}: {e}')
+            return False
+
+
+async def redeem_all(w3, account, by_condition, estimate_gas=False):
+    """Redeem every condition concurrently; returns (success_count, fail_count)."""
+    wallet = account.address
+
+    calldata = {}
+    for cid, positions in by_condition.items():
+        print(f'Redeeming: {positions[0]["title"]}')
+        print(f'  Condition ID: {cid}')
+        calldata[cid] = encode_redeem(cid)
+    print()
+
+    # Fetch nonce, fee history and (optionally) every gas estimate in one JSON-RPC batch
+    requests_batch = [
+        ('eth_getTransactionCount', [wallet, 'pending']),
+        ('eth_feeHistory', [4, 'latest', [50]])
+    ]
+    if estimate_gas:
+        requests_batch += [
+            ('eth_estimateGas', [{'from': wallet, 'to': CTF_ADDRESS, 'data': data}])
+            for data in calldata.values()
+        ]
+    responses = await w3.provider.make_batch_request(requests_batch)
+    nonce_response, fee_history_response = responses[0], responses[1]
+    for response in (nonce_response, fee_history_response):
+        if 'error' in response:
+            raise RuntimeError(f"RPC error: {response['error']}")
+    base_nonce = int(nonce_response['result'], 16)
+    max_fee, priority_fee = fees_from_history(fee_history_response['result'])
+    print(f'Max fee: {max_fee / 1e9:.2f} gwei (priority {priority_fee / 1e9:.2f} gwei)\n')
+
+    # Every field but calldata (and later the nonce) is shared across markets
+    txn_template = {
+        'from': wallet,
+        'to': CTF_ADDRESS,
+        'value': 0,
+        'gas': REDEEM_GAS_LIMIT,
+        'maxFeePerGas': max_fee,
+        'maxPriorityFeePerGas': priority_fee,
+        'type': 2,
+        'chainId': 137
+    }
+
+    transactions = []
+    estimates = responses[2:] if estimate_gas else [None] * len(calldata)
+    for (cid, data), estimate in zip(calldata.items(), estimates):
+        market_title = by_condition[cid][0]['title']
+        redeem_txn = {**txn_template, 'data': data}
+
+        if estimate is None:
+            pass
+        elif 'error' in estimate:
+            print(f'  [{market_title}] Could not estimate gas: {estimate["error"]}')
+            print(f'  [{market_title}] Using default: {REDEEM_GAS_LIMIT}')
         else:
-            print(f'  [FAILED] Transaction reverted')
-            fail_count += 1
+            estimated_gas = int(estimate['result'], 16)
+            redeem_txn['gas'] = int(estimated_gas * 1.2)
+            print(f'  [{market_title}] Estimated Gas: {estimated_gas}')
+
+        transactions.append((market_title, redeem_txn))
+
+    send_lock = asyncio.Lock()
+    next_nonce = [base_nonce]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REDEMPTIONS)
+
+    async with ConfirmationManager(fallback_w3=w3) as confirmations:
+        results = await asyncio.gather(*[
+            redeem_one(w3, account, market_title, redeem_txn, send_lock, next_nonce, semaphore, confirmations)
+            for market_title, redeem_txn in transactions
+        ])
+
+    success_count = sum(1 for ok in results if ok)
+    return success_count, len(results) - success_count
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Redeem all redeemable Polymarket positions")
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Skip the confirmation prompt"
+    )
+    parser.add_argument(
+        "--market-slug",
+        help="Only redeem positions in this market"
+    )
+    parser.add_argument(
+        "--condition-id",
+        help="Only redeem positions with this condition ID"
+    )
+    parser.add_argument(
+        "--estimate-gas",
+        action="store_true",
+        help=f"Estimate gas per redemption instead of using a fixed {REDEEM_GAS_LIMIT} limit"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and redeem every --interval seconds (implies --yes)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=DAEMON_INTERVAL_SECONDS,
+        help=f"Seconds between redemption cycles in daemon mode (default: {DAEMON_INTERVAL_SECONDS})"
+    )
+    args = parser.parse_args()
+    if args.daemon:
+        args.yes = True
+
+    print('='*60)
+    print('Polymarket Position Redemption')
+    print('='*60)
+
+    # Initialize Web3 on one pooled keep-alive aiohttp session
+    RPC_URL = Config.RPC_URL
+    provider = AsyncHTTPProvider(RPC_URL, request_kwargs={'timeout': aiohttp.ClientTimeout(total=10)})
+    rpc_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20))
+    await provider.cache_async_session(rpc_session)
+    w3 = AsyncWeb3(provider)
+
+    # Derive the wallet once; every daemon cycle signs with the same account
+    account = w3.eth.account.from_key(Config.PRIVATE_KEY)
+
+    try:
+        if args.daemon:
+            return await daemon(w3, account, args)
+        return await run_once(w3, account, args)
+    finally:
+        await rpc_session.close()
 
-    except Exception as e:
-        print(f'  [ERROR] {e}')
-        fail_count += 1
 
+async def daemon(w3, account, args):
+    """Run redemption cycles forever, reusing the same connections, account and caches."""
+    while True:
+        try:
+            await run_once(w3, account, args)
+        except Exception as e:
+            print(f'ERROR: Redemption cycle failed: {e}')
+        print(f'\nNext check in {args.interval}s...\n')
+        await asyncio.sleep(args.interval)
+
+
+async def run_once(w3, account, args):
+    """Fetch redeemable positions, confirm with the user and redeem them."""
+    if not await w3.is_connected():
+        print("ERROR: Cannot connect to Polygon")
+        return 1
+
+    wallet = account.address
+
+    print(f'Wallet: {wallet}\n')
+
+    # Fetch only redeemable positions; the API filters server-side
+    print('Fetching redeemable positions from Polymarket API...')
+    api_url = "https://data-api.polymarket.com/positions"
+    response = session.get(api_url, params={'user': wallet, 'redeemable': 'true'}, timeout=10)
+
+    if response.status_code != 200:
+        print(f'ERROR: Failed to fetch positions (status {response.status_code})')
+        return 1
+
+    positions = response.json()
+
+    if not positions:
+        print('No redeemable positions found.')
+        print('All positions have been redeemed or markets are not yet resolved.')
+        return 0
+
+    # Filter redeemable positions (re-checked client-side)
+    redeemable = [
+        p for p in positions
+        if p.get('redeemable', False)
+        and (not args.market_slug or p['slug'] == args.market_slug)
+        and (not args.condition_id or p['conditionId'] == args.condition_id)
+    ]
+
+    if not redeemable:
+        print('No redeemable positions found.')
+        print('All positions have been redeemed or markets are not yet resolved.')
+        return 0
+
+    print(f'Found {len(redeemable)} redeemable position(s):\n')
+
+    # Group by condition ID, accumulating market values in the same pass
+    by_condition = {}
+    market_values = {}
+    for pos in redeemable:
+        cid = pos['conditionId']
+        by_condition.setdefault(cid, []).append(pos)
+        market_values[cid] = market_values.get(cid, 0) + pos['currentValue']
+
+    total_value = sum(market_values.values())
+
+    # Display summary
+    for cid, positions in by_condition.items():
+        market_title = positions[0]['title']
+        market_slug = positions[0]['slug']
+        market_value = market_values[cid]
+
+        print(f'Market: {market_title}')
+        print(f'  Slug: {market_slug}')
+        print(f'  Condition ID: {cid}')
+        print(f'  Positions: {len(positions)}')
+        print(f'  Total Value: ${market_value:.2f}')
+        for p in positions:
+            print(f'    - {p["outcome"]}: {p["size"]} shares @ ${p["curPrice"]:.2f} = ${p["currentValue"]:.2f}')
+        print()
+
+    print(f'TOTAL REDEEMABLE VALUE: ${total_value:.2f}\n')
+
+    # Ask for confirmation
+    if not args.yes:
+        response = input(f'Redeem all positions? This will burn CTF tokens and return ${total_value:.2f} USDC to your wallet. (yes/no): ').strip().lower()
+
+        if response != 'yes':
+            print('Redemption cancelled.')
+            return 0
+
+    # Redeem all markets concurrently
+    print('\n' + '='*60)
+    print('Starting Redemption')
+    print('='*60 + '\n')
+
+    success_count, fail_count = await redeem_all(w3, account, by_condition, args.estimate_gas)
+
+    # Summary
     print()
+    print('='*60)
+    print('Redemption Complete')
+    print('='*60)
+    print(f'Successful: {success_count}/{len(by_condition)}')
+    print(f'Failed: {fail_count}/{len(by_condition)}')
+
+    if success_count > 0:
+        print(f'\n${total_value:.2f} USDC has been returned to your wallet!')
+        print('Check your balance with: py check_all_usdc.py')
 
-# Summary
-print('='*60)
-print('Redemption Complete')
-print('='*60)
-print(f'Successful: {success_count}/{len(by_condition)}')
-print(f'Failed: {fail_count}/{len(by_condition)}')
+    print('='*60)
+    return 0
 
-if success_count > 0:
-    print(f'\n${total_value:.2f} USDC has been returned to your wallet!')
-    print('Check your balance with: py check_all_usdc.py')
 
-print('='*60)
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
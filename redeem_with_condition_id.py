@@ -1,6 +1,10 @@
 """Simple redemption script - just provide the condition ID."""
-from web3 import Web3
-from config import Config
+import argparse
+import os
+from confirmation_manager import wait_for_receipt
+from polymarket_contracts import CTF_ADDRESS, REDEEM_GAS_LIMIT, encode_redeem
+from redemption_core import get_account, get_position_balances, get_position_ids, get_w3
+from rpc_config import fees_from_history
 
 # ============================================================
 # CONFIGURATION - UPDATE THIS WITH YOUR CONDITION ID
@@ -10,8 +14,23 @@ from config import Config
 # 1. PolygonScan transaction event logs
 # 2. Original market data
 # 3. Polymarket API (if market still exists)
+#
+# Pass it with --condition-id or CONDITION_ID in the environment to skip the prompt.
+
+parser = argparse.ArgumentParser(description="Redeem CTF positions for a condition ID")
+parser.add_argument(
+    "--condition-id",
+    default=os.getenv("CONDITION_ID"),
+    help="Condition ID to redeem (0x..., 66 characters)"
+)
+parser.add_argument(
+    "--estimate-gas",
+    action="store_true",
+    help=f"Estimate gas instead of using a fixed {REDEEM_GAS_LIMIT} limit"
+)
+args = parser.parse_args()
 
-CONDITION_ID = input("Enter the condition ID (0x...): ").strip()
+CONDITION_ID = (args.condition_id or input("Enter the condition ID (0x...): ")).strip()
 
 if not CONDITION_ID or not CONDITION_ID.startswith("0x") or len(CONDITION_ID) != 66:
     print("ERROR: Invalid condition ID format")
@@ -26,86 +45,61 @@ print('='*60)
 print('Redeeming CTF Positions')
 print('='*60)
 
-RPC_URL = Config.RPC_URL
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
+w3 = get_w3()
 
 if not w3.is_connected():
     print("ERROR: Cannot connect to Polygon")
     exit(1)
 
 # Get wallet
-private_key = Config.PRIVATE_KEY
-account = w3.eth.account.from_key(private_key)
+account = get_account()
 wallet = account.address
 
 print(f'Wallet: {wallet}')
 print(f'Condition ID: {CONDITION_ID}\n')
 
-# Contract addresses
-CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-
-# ABI
-REDEEM_ABI = [{
-    "constant": False,
-    "inputs": [
-        {"name": "collateralToken", "type": "address"},
-        {"name": "parentCollectionId", "type": "bytes32"},
-        {"name": "conditionId", "type": "bytes32"},
-        {"name": "indexSets", "type": "uint256[]"}
-    ],
-    "name": "redeemPositions",
-    "outputs": [],
-    "type": "function"
-}]
-
-ctf = w3.eth.contract(
-    address=Web3.to_checksum_address(CTF_ADDRESS),
-    abi=REDEEM_ABI
-)
-
-# Redemption parameters
-collateral_token = Web3.to_checksum_address(USDC_ADDRESS)
-parent_collection_id = b'\x00' * 32
-condition_id_bytes = bytes.fromhex(CONDITION_ID[2:])
-index_sets = [1, 2]  # Binary market: redeem both Up and Down
+try:
+    # Skip the whole send-and-wait path if there is nothing to redeem
+    if not any(get_position_balances(wallet, get_position_ids(CONDITION_ID))):
+        print('No tokens held for this condition - already redeemed or never held.')
+        exit(0)
 
-print('Building redemption transaction...')
+    print('Building redemption transaction...')
 
-try:
-    # Build transaction
+    # Build transaction from the shared precomputed calldata (both Up and Down)
     nonce = w3.eth.get_transaction_count(wallet)
-    gas_price = w3.eth.gas_price
-
-    redeem_txn = ctf.functions.redeemPositions(
-        collateral_token,
-        parent_collection_id,
-        condition_id_bytes,
-        index_sets
-    ).build_transaction({
+    max_fee, priority_fee = fees_from_history(w3.eth.fee_history(4, 'latest', [50]))
+
+    redeem_txn = {
         'from': wallet,
+        'to': CTF_ADDRESS,
+        'data': encode_redeem(CONDITION_ID),
+        'value': 0,
         'nonce': nonce,
-        'gas': 300000,
-        'gasPrice': gas_price,
+        'gas': REDEEM_GAS_LIMIT,
+        'maxFeePerGas': max_fee,
+        'maxPriorityFeePerGas': priority_fee,
+        'type': 2,
         'chainId': 137
-    })
+    }
 
     print(f'  Nonce: {nonce}')
-    print(f'  Gas Price: {w3.from_wei(gas_price, "gwei"):.2f} gwei')
+    print(f'  Max Fee: {w3.from_wei(max_fee, "gwei"):.2f} gwei (priority {w3.from_wei(priority_fee, "gwei"):.2f} gwei)')
 
     # Estimate gas
-    try:
-        estimated_gas = w3.eth.estimate_gas(redeem_txn)
-        redeem_txn['gas'] = int(estimated_gas * 1.2)
-        print(f'  Estimated Gas: {estimated_gas}')
-        tx_cost_matic = w3.from_wei(redeem_txn['gas'] * gas_price, 'ether')
-        print(f'  TX Cost: ~{tx_cost_matic:.6f} MATIC')
-    except Exception as e:
-        print(f'  Could not estimate gas: {e}')
-        print(f'  Using default: 300000')
+    if args.estimate_gas:
+        try:
+            estimated_gas = w3.eth.estimate_gas(redeem_txn)
+            redeem_txn['gas'] = int(estimated_gas * 1.2)
+            print(f'  Estimated Gas: {estimated_gas}')
+        except Exception as e:
+            print(f'  Could not estimate gas: {e}')
+            print(f'  Using default: {redeem_txn["gas"]}')
+    tx_cost_matic = w3.from_wei(redeem_txn['gas'] * max_fee, 'ether')
+    print(f'  TX Cost: ~{tx_cost_matic:.6f} MATIC (max)')
 
     print('\nSigning transaction...')
-    signed_txn = w3.eth.account.sign_transaction(redeem_txn, private_key)
+    signed_txn = account.sign_transaction(redeem_txn)
 
     print('Sending transaction...')
     tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
@@ -115,7 +109,7 @@ try:
     print(f'PolygonScan: https://polygonscan.com/tx/{tx_hash.hex()}')
 
     print('\nWaiting for confirmation (max 2 minutes)...')
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    receipt = wait_for_receipt(tx_hash, timeout=120)
 
     print('\n' + '='*60)
     if receipt.status == 1:
@@ -0,0 +1,90 @@
+"""Shared, lazily built redemption resources for the redeem_* scripts."""
+
+from functools import lru_cache
+from typing import List
+from web3 import Web3
+from config import Config
+from rpc_config import create_web3
+from polymarket_contracts import CTF_ADDRESS, CTF_VIEW_ABI, INDEX_SETS, REDEEM_ABI, USDC_ADDRESS
+
+# alt_bn128 field modulus and curve constant used by CTHelpers.getCollectionId
+_BN128_P = 21888242871839275222246405745257275088696311157297823662689037894645226208583
+_BN128_B = 3
+
+
+@lru_cache(maxsize=1)
+def get_w3() -> Web3:
+    """Get the shared Polygon Web3 instance."""
+    return create_web3(Config.RPC_URL)
+
+
+@lru_cache(maxsize=1)
+def get_account():
+    """Get the wallet account for Config.PRIVATE_KEY."""
+    return get_w3().eth.account.from_key(Config.PRIVATE_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_ctf_contract():
+    """Get the CTF contract bound to the shared Web3 instance."""
+    return get_w3().eth.contract(address=CTF_ADDRESS, abi=REDEEM_ABI)
+
+
+@lru_cache(maxsize=1)
+def get_ctf_view_contract():
+    """Get the read-only CTF view contract bound to the shared Web3 instance."""
+    return get_w3().eth.contract(address=CTF_ADDRESS, abi=CTF_VIEW_ABI)
+
+
+def get_collection_id(condition_id: bytes, index_set: int) -> bytes:
+    """
+    Compute a top-level collection ID the way CTHelpers.getCollectionId does.
+
+    The (condition, index set) hash is mapped onto the alt_bn128 curve and the
+    resulting point is compressed into 32 bytes. Only the null parent
+    collection used by Polymarket is supported.
+    """
+    x = int.from_bytes(Web3.solidity_keccak(['bytes32', 'uint256'], [condition_id, index_set]), 'big')
+    odd = x >> 255 != 0
+
+    # Walk x forward until x^3 + B is a square; P = 3 mod 4, so the root is a power
+    while True:
+        x = (x + 1) % _BN128_P
+        yy = (pow(x, 3, _BN128_P) + _BN128_B) % _BN128_P
+        y = pow(yy, (_BN128_P + 1) // 4, _BN128_P)
+        if y * y % _BN128_P == yy:
+            break
+
+    if odd != (y % 2 == 1):
+        y = _BN128_P - y
+    if y % 2 == 1:
+        x ^= 1 << 254
+    return x.to_bytes(32, 'big')
+
+
+def get_position_ids(condition_id: str) -> List[int]:
+    """
+    Derive the ERC1155 position IDs for both outcomes of a condition locally.
+
+    Args:
+        condition_id: Condition ID (0x-prefixed hex)
+
+    Returns:
+        Position IDs in INDEX_SETS order
+    """
+    condition_id_bytes = bytes.fromhex(condition_id[2:])
+
+    position_ids = []
+    for index_set in INDEX_SETS:
+        collection_id = get_collection_id(condition_id_bytes, index_set)
+        position_id = Web3.solidity_keccak(['address', 'bytes32'], [USDC_ADDRESS, collection_id])
+        position_ids.append(int.from_bytes(position_id, 'big'))
+    return position_ids
+
+
+def get_position_balances(wallet: str, position_ids: List[int]) -> List[int]:
+    """Read the wallet's balance of every position ID in one balanceOfBatch call."""
+    return get_ctf_view_contract().functions.balanceOfBatch(
+        [wallet] * len(position_ids), position_ids
+    ).call()
+
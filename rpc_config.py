@@ -1,8 +1,58 @@
 """Shared RPC configuration loaded from environment variables."""
 
 import os
+import statistics
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Tuple
+from web3 import Web3
 
 load_dotenv()
 
 RPC_URL = os.getenv("RPC_URL", "https://polygon-rpc.com")
+
+# (connect, read) timeout for RPC requests
+RPC_TIMEOUT = (3, 10)
+
+# EIP-1559 priority fee floor (Polygon rejects tips below ~30 gwei)
+MIN_PRIORITY_FEE = 30 * 10**9
+
+
+def create_web3(rpc_url: str = RPC_URL) -> Web3:
+    """Create a Web3 instance on a pooled keep-alive HTTP session."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    ))
+    return Web3(Web3.HTTPProvider(
+        rpc_url,
+        session=session,
+        request_kwargs={"timeout": RPC_TIMEOUT}
+    ))
+
+
+def _quantity(value) -> int:
+    """Convert a raw hex or already-decoded JSON-RPC quantity to int."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def fees_from_history(fee_history) -> Tuple[int, int]:
+    """
+    Derive EIP-1559 fees from an eth_feeHistory result (raw or web3-decoded).
+
+    Requires the history to be queried with a single reward percentile.
+
+    Returns:
+        Tuple of (max_fee_per_gas, max_priority_fee_per_gas) in wei
+    """
+    # The last baseFeePerGas entry is the pending block's base fee
+    base_fee = _quantity(fee_history['baseFeePerGas'][-1])
+    tip = max(
+        MIN_PRIORITY_FEE,
+        int(statistics.median(_quantity(reward[0]) for reward in fee_history['reward']))
+    )
+    return 2 * base_fee + tip, tip
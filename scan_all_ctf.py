@@ -1,6 +1,12 @@
 """Scan for all CTF token holdings by checking Transfer events."""
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from web3 import Web3
 from config import Config
+from polymarket_contracts import CTF_ADDRESS, MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+# Block window per eth_getLogs request (public RPCs reject wide ranges)
+LOG_CHUNK_BLOCKS = 500
+MAX_LOG_WORKERS = 8
 
 print('='*60)
 print('Scanning All CTF Token Holdings')
@@ -20,9 +26,6 @@ wallet = account.address
 
 print(f'Wallet: {wallet}\n')
 
-# CTF Contract (ERC1155)
-CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-
 # Full ERC1155 ABI
 ERC1155_ABI = [
     {
@@ -61,10 +64,75 @@ ERC1155_ABI = [
     }
 ]
 
-ctf = w3.eth.contract(
-    address=Web3.to_checksum_address(CTF_ADDRESS),
-    abi=ERC1155_ABI
-)
+ctf = w3.eth.contract(address=CTF_ADDRESS, abi=ERC1155_ABI)
+
+multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+
+def fetch_window(lo, hi):
+    """Fetch TransferSingle events to the wallet in one block window."""
+    return ctf.events.TransferSingle.get_logs(
+        from_block=lo,
+        to_block=hi,
+        argument_filters={'to': wallet}
+    )
+
+
+def scan_holdings(from_block, to_block):
+    """
+    Fetch transfers in parallel block windows and read balances as token IDs appear.
+
+    Each window's new token IDs go straight to a Multicall3 balance read on the
+    same pool, so balance reads overlap with the remaining log fetches.
+
+    Returns:
+        Tuple of (transfers in block order, {token_id: balance})
+    """
+    windows = [
+        (lo, min(lo + LOG_CHUNK_BLOCKS - 1, to_block))
+        for lo in range(from_block, to_block + 1, LOG_CHUNK_BLOCKS)
+    ]
+
+    with ThreadPoolExecutor(max_workers=MAX_LOG_WORKERS) as executor:
+        log_futures = {
+            executor.submit(fetch_window, lo, hi): index
+            for index, (lo, hi) in enumerate(windows)
+        }
+        chunks = [None] * len(windows)
+        seen = set()
+        balance_futures = []
+
+        for future in as_completed(log_futures):
+            events = future.result()
+            chunks[log_futures[future]] = events
+
+            new_ids = list({event['args']['id'] for event in events} - seen)
+            if new_ids:
+                seen.update(new_ids)
+                balance_futures.append(executor.submit(fetch_balances, new_ids))
+
+        balances = {}
+        for future in balance_futures:
+            balances.update(future.result())
+
+    return [event for chunk in chunks for event in chunk], balances
+
+
+def fetch_balances(token_ids):
+    """Read balanceOf for every token ID in a single Multicall3 eth_call."""
+    calls = [
+        (ctf.address, True, ctf.encode_abi('balanceOf', args=[wallet, token_id]))
+        for token_id in token_ids
+    ]
+    results = multicall.functions.aggregate3(calls).call()
+
+    balances = {}
+    for token_id, (success, return_data) in zip(token_ids, results):
+        if not success:
+            raise RuntimeError(f'balanceOf reverted for token {token_id}')
+        balances[token_id] = w3.codec.decode(['uint256'], return_data)[0]
+    return balances
+
 
 print('Fetching recent CTF transfers to your wallet...')
 print('(This may take a moment)\n')
@@ -76,14 +144,8 @@ try:
 
     print(f'Scanning blocks {from_block} to {current_block}...\n')
 
-    # Get TransferSingle events where 'to' is your wallet
-    transfer_filter = ctf.events.TransferSingle.create_filter(
-        from_block=from_block,
-        to_block='latest',
-        argument_filters={'to': wallet}
-    )
-
-    transfers = transfer_filter.get_all_entries()
+    # Get TransferSingle events where 'to' is your wallet, plus current balances
+    transfers, balances = scan_holdings(from_block, current_block)
 
     if not transfers:
         print('No recent transfers found.')
@@ -110,7 +172,7 @@ try:
 
         total_value = 0
         for token_id in token_ids:
-            balance = ctf.functions.balanceOf(wallet, token_id).call()
+            balance = balances[token_id]
             balance_formatted = balance / 1_000_000
 
             print(f'Token ID: {token_id}')
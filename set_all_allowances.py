@@ -1,6 +1,14 @@
 """Set all required allowances for Polymarket trading."""
-from web3 import Web3
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from web3.exceptions import Web3RPCError
 from config import Config
+from rpc_config import create_web3, fees_from_history
+from polymarket_contracts import (
+    CTF_ADDRESS, SPENDERS, USDC_ADDRESS, ctf, encode_approve, encode_set_approval_for_all,
+    multicall, usdc
+)
 
 print('Setting ALL Polymarket Allowances')
 print('='*60)
@@ -8,52 +16,12 @@ print('='*60)
 # Polygon RPC endpoint
 RPC_URL = Config.RPC_URL
 
-# Contract addresses on Polygon
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"  # Conditional Tokens
-
-# Spender addresses (all three exchanges)
-SPENDERS = [
-    ("0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E", "CTF Exchange"),
-    ("0xC5d563A36AE78145C45a50134d48A1215220f80a", "Neg Risk CTF Exchange"),
-    ("0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296", "Neg Risk Adapter")
-]
-
-# ERC20 approve ABI
-ERC20_ABI = [{
-    "constant": False,
-    "inputs": [
-        {"name": "_spender", "type": "address"},
-        {"name": "_value", "type": "uint256"}
-    ],
-    "name": "approve",
-    "outputs": [{"name": "", "type": "bool"}],
-    "type": "function"
-}]
-
-# ERC1155 setApprovalForAll ABI
-ERC1155_ABI = [{
-    "constant": False,
-    "inputs": [
-        {"name": "operator", "type": "address"},
-        {"name": "approved", "type": "bool"}
-    ],
-    "name": "setApprovalForAll",
-    "outputs": [],
-    "type": "function"
-}, {
-    "constant": True,
-    "inputs": [
-        {"name": "account", "type": "address"},
-        {"name": "operator", "type": "address"}
-    ],
-    "name": "isApprovedForAll",
-    "outputs": [{"name": "", "type": "bool"}],
-    "type": "function"
-}]
+# Known-approved (spender, token) pairs, re-validated on-chain once stale
+ALLOWANCE_CACHE_FILE = ".allowance_cache.json"
+ALLOWANCE_CACHE_MAX_AGE_HOURS = 24
 
 # Initialize Web3
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
+w3 = create_web3(RPC_URL)
 
 if not w3.is_connected():
     print("ERROR: Could not connect to Polygon RPC")
@@ -69,15 +37,11 @@ wallet_address = account.address
 print(f"Wallet: {wallet_address}\n")
 
 # Create contract instances
-usdc_contract = w3.eth.contract(
-    address=Web3.to_checksum_address(USDC_ADDRESS),
-    abi=ERC20_ABI
-)
+usdc_contract = usdc(w3)
 
-ctf_contract = w3.eth.contract(
-    address=Web3.to_checksum_address(CTF_ADDRESS),
-    abi=ERC1155_ABI
-)
+ctf_contract = ctf(w3)
+
+multicall_contract = multicall(w3)
 
 # Track transactions
 txs = []
@@ -85,44 +49,158 @@ txs = []
 # Approve amount (1 million USDC)
 approve_amount = 1_000_000 * 1_000_000
 
-for spender_address, spender_name in SPENDERS:
-    print(f"Processing {spender_name}...")
-    print(f"  Address: {spender_address}")
+spender_checksums = [address for address, _ in SPENDERS]
+required_pairs = {f"{spender}:{token}" for spender in spender_checksums for token in ("USDC", "CTF")}
+
+
+def load_allowance_cache() -> dict:
+    """Load the allowance cache file, or an empty cache if missing/unreadable."""
+    try:
+        with open(ALLOWANCE_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Skip every RPC round trip when a fresh cache says everything is approved
+cache_key = f"{wallet_address}:{Config.CHAIN_ID}"
+allowance_cache = load_allowance_cache()
+cached = allowance_cache.get(cache_key, {})
+cache_age_hours = (time.time() - cached.get("checked_at", 0)) / 3600
+if cache_age_hours < ALLOWANCE_CACHE_MAX_AGE_HOURS and required_pairs <= set(cached.get("approved", [])):
+    print(f"All allowances already set (checked {cache_age_hours:.1f}h ago), nothing to do.")
+    print(f"Delete {ALLOWANCE_CACHE_FILE} to force a re-check.")
+    exit(0)
+
+# Every isApprovedForAll flag and USDC allowance is read in a single Multicall3
+# eth_call, so the node executes them locally instead of as separate requests
+approval_calls = [
+    (ctf_contract.address, False, ctf_contract.encode_abi('isApprovedForAll', args=[wallet_address, spender]))
+    for spender in spender_checksums
+] + [
+    (usdc_contract.address, False, usdc_contract.encode_abi('allowance', args=[wallet_address, spender]))
+    for spender in spender_checksums
+]
+
+# Read the nonce, recent fee history and the approval multicall in one JSON-RPC
+# batch. Nonces are then assigned locally so every approval can be broadcast
+# back-to-back without waiting on the previous one
+responses = w3.provider.make_batch_request([
+    ('eth_getTransactionCount', [wallet_address, 'pending']),
+    ('eth_feeHistory', [5, 'latest', [50]]),
+    ('eth_call', [{
+        'to': multicall_contract.address,
+        'data': multicall_contract.encode_abi('aggregate3', args=[approval_calls])
+    }, 'latest'])
+])
+# A provider that rejects the whole batch returns a single error object instead of a list
+if not isinstance(responses, list):
+    error = responses.get('error', responses) if isinstance(responses, dict) else responses
+    print(f"ERROR: RPC batch request rejected: {error}")
+    print("Check that RPC_URL points to a provider that supports JSON-RPC batching.")
+    exit(1)
+for response in responses:
+    if 'error' in response:
+        print(f"ERROR: RPC batch failed: {response['error']}")
+        exit(1)
+
+nonce = int(responses[0]['result'], 16)
+
+# Fees are derived once and reused for every approval: the base fee barely moves
+# across a handful of back-to-back transactions
+max_fee, priority_fee = fees_from_history(responses[1]['result'])
+
+# Every field but the target, calldata and nonce is shared across approvals, so
+# transactions are built from precomputed calldata instead of contract proxies
+txn_template = {
+    'from': wallet_address,
+    'value': 0,
+    'gas': 100000,
+    'maxFeePerGas': max_fee,
+    'maxPriorityFeePerGas': priority_fee,
+    'type': 2,
+    'chainId': 137
+}
+
+(approval_results,) = w3.codec.decode(['(bool,bytes)[]'], bytes.fromhex(responses[2]['result'][2:]))
+approval_values = [return_data for _, return_data in approval_results]
+spender_count = len(spender_checksums)
+ctf_approved = [
+    w3.codec.decode(['bool'], return_data)[0]
+    for return_data in approval_values[:spender_count]
+]
+usdc_approved = [
+    w3.codec.decode(['uint256'], return_data)[0] >= approve_amount // 2
+    for return_data in approval_values[spender_count:]
+]
+
+approved_pairs = set()
+for spender, usdc_ok, ctf_ok in zip(spender_checksums, usdc_approved, ctf_approved):
+    if usdc_ok:
+        approved_pairs.add(f"{spender}:USDC")
+    if ctf_ok:
+        approved_pairs.add(f"{spender}:CTF")
 
-    spender_checksum = Web3.to_checksum_address(spender_address)
+# (spender_name, spender, token, tx_hash) for every broadcast transaction
+pending = []
+
+
+def is_nonce_error(error) -> bool:
+    """Check whether a send failed because our local nonce went stale."""
+    message = str(error).lower()
+    return 'nonce' in message or 'underpriced' in message
+
+
+def send(txn, spender_name, spender, token):
+    """
+    Sign and broadcast a transaction with the next local nonce.
+
+    If another transaction from this wallet took the nonce (e.g. one sent by
+    the operator while this script runs), the pending nonce is re-read and the
+    transaction is re-signed and sent once more.
+    """
+    global nonce
+    txn['nonce'] = nonce
+    try:
+        tx_hash = w3.eth.send_raw_transaction(account.sign_transaction(txn).raw_transaction)
+    except (ValueError, Web3RPCError) as e:
+        if not is_nonce_error(e):
+            raise
+        nonce = w3.eth.get_transaction_count(wallet_address, 'pending')
+        print(f"        Nonce conflict ({e}), retrying with nonce {nonce}")
+        txn['nonce'] = nonce
+        tx_hash = w3.eth.send_raw_transaction(account.sign_transaction(txn).raw_transaction)
+    nonce += 1
+    pending.append((spender_name, spender, token, tx_hash))
+    print(f"        TX: {tx_hash.hex()}")
+
+
+def wait_for_receipt(tx_hash):
+    """Wait for a receipt, returning the exception instead of raising it."""
+    try:
+        return w3.eth.wait_for_transaction_receipt(tx_hash, timeout=180, poll_latency=1.0)
+    except Exception as e:
+        return e
+
+
+for (spender_checksum, spender_name), usdc_ok, is_approved in zip(SPENDERS, usdc_approved, ctf_approved):
+    print(f"Processing {spender_name}...")
+    print(f"  Address: {spender_checksum}")
 
     # 1. Check and approve USDC (ERC20)
     print(f"  [1/2] Approving USDC...")
     try:
-        # Build USDC approve transaction
-        nonce = w3.eth.get_transaction_count(wallet_address)
-        gas_price = w3.eth.gas_price
-
-        approve_txn = usdc_contract.functions.approve(
-            spender_checksum,
-            approve_amount
-        ).build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': 100000,
-            'gasPrice': gas_price,
-            'chainId': 137
-        })
-
-        # Sign and send
-        signed_txn = w3.eth.account.sign_transaction(approve_txn, private_key)
-        tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-
-        print(f"        TX: {tx_hash.hex()}")
-
-        # Wait for confirmation
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-
-        if receipt.status == 1:
-            print(f"        SUCCESS (Gas: {receipt.gasUsed})")
-            txs.append((spender_name, "USDC", tx_hash.hex()))
+        if usdc_ok:
+            print(f"        USDC already approved, skipping")
         else:
-            print(f"        FAILED")
+            # Build USDC approve transaction
+            approve_txn = {
+                **txn_template,
+                'to': USDC_ADDRESS,
+                'data': encode_approve(spender_checksum, approve_amount)
+            }
+
+            send(approve_txn, spender_name, spender_checksum, "USDC")
 
     except Exception as e:
         print(f"        ERROR: {e}")
@@ -130,50 +208,51 @@ for spender_address, spender_name in SPENDERS:
     # 2. Check and approve CTF (ERC1155)
     print(f"  [2/2] Approving Conditional Tokens...")
     try:
-        # Check if already approved
-        is_approved = ctf_contract.functions.isApprovedForAll(
-            wallet_address,
-            spender_checksum
-        ).call()
-
         if is_approved:
             print(f"        Already approved, skipping")
         else:
             # Build setApprovalForAll transaction
-            nonce = w3.eth.get_transaction_count(wallet_address)
-            gas_price = w3.eth.gas_price
-
-            approval_txn = ctf_contract.functions.setApprovalForAll(
-                spender_checksum,
-                True
-            ).build_transaction({
-                'from': wallet_address,
-                'nonce': nonce,
-                'gas': 100000,
-                'gasPrice': gas_price,
-                'chainId': 137
-            })
-
-            # Sign and send
-            signed_txn = w3.eth.account.sign_transaction(approval_txn, private_key)
-            tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-
-            print(f"        TX: {tx_hash.hex()}")
-
-            # Wait for confirmation
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-
-            if receipt.status == 1:
-                print(f"        SUCCESS (Gas: {receipt.gasUsed})")
-                txs.append((spender_name, "CTF", tx_hash.hex()))
-            else:
-                print(f"        FAILED")
+            approval_txn = {
+                **txn_template,
+                'to': CTF_ADDRESS,
+                'data': encode_set_approval_for_all(spender_checksum, True)
+            }
+
+            send(approval_txn, spender_name, spender_checksum, "CTF")
 
     except Exception as e:
         print(f"        ERROR: {e}")
 
     print()
 
+# Wait for all broadcast transactions as a group, polling every receipt
+# concurrently so confirmation waits overlap
+receipts = []
+if pending:
+    print(f'Waiting for {len(pending)} transaction(s) to confirm...')
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        receipts = list(executor.map(wait_for_receipt, [tx_hash for *_, tx_hash in pending]))
+
+for (spender_name, spender, token, tx_hash), receipt in zip(pending, receipts):
+    if isinstance(receipt, Exception):
+        print(f"  {spender_name} ({token}): ERROR: {receipt}")
+    elif receipt.status == 1:
+        print(f"  {spender_name} ({token}): SUCCESS (Gas: {receipt.gasUsed})")
+        txs.append((spender_name, token, tx_hash.hex()))
+        approved_pairs.add(f"{spender}:{token}")
+    else:
+        print(f"  {spender_name} ({token}): FAILED")
+
+print()
+
+# Remember what is approved so the next run can skip the on-chain checks
+allowance_cache[cache_key] = {"checked_at": time.time(), "approved": sorted(approved_pairs)}
+try:
+    with open(ALLOWANCE_CACHE_FILE, "w") as f:
+        json.dump(allowance_cache, f, indent=2)
+except OSError as e:
+    print(f"Warning: could not write {ALLOWANCE_CACHE_FILE}: {e}")
+
 # Summary
 print('='*60)
 print('SUMMARY')
@@ -182,5 +261,10 @@ print(f'Completed {len(txs)} transactions:')
 for spender, token, tx in txs:
     print(f'  - {spender} ({token}): {tx}')
 
+missing = required_pairs - approved_pairs
+if missing:
+    print(f'\n{len(missing)} allowance(s) are still missing - re-run this script.')
+    exit(1)
+
 print('\nAll allowances have been set!')
 print('You can now trade on Polymarket with the bot.')
@@ -1,6 +1,8 @@
 """Set USDC allowance for Polymarket trading."""
 from web3 import Web3
 from config import Config
+from rpc_config import create_web3, fees_from_history
+from polymarket_contracts import USDC_ADDRESS, encode_approve, usdc
 
 print('Setting USDC Allowance for Polymarket Trading')
 print('='*60)
@@ -8,43 +10,12 @@ print('='*60)
 # Polygon RPC endpoint
 RPC_URL = Config.RPC_URL
 
-# Contract addresses on Polygon
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"  # USDC on Polygon
-EXCHANGE_ADDRESS = "0xC5d563A36AE78145C45a50134d48A1215220f80a"  # Polymarket NegRisk CTF Exchange
-
-# ERC20 approve function ABI
-ERC20_ABI = [
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_spender", "type": "address"},
-            {"name": "_value", "type": "uint256"}
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function"
-    },
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "_owner", "type": "address"},
-            {"name": "_spender", "type": "address"}
-        ],
-        "name": "allowance",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function"
-    }
-]
+# Spender address on Polygon
+# (checksummed once; account addresses are already checksummed)
+EXCHANGE_ADDRESS = Web3.to_checksum_address("0xC5d563A36AE78145C45a50134d48A1215220f80a")  # Polymarket NegRisk CTF Exchange
 
 # Initialize Web3
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
-
-if not w3.is_connected():
-    print("ERROR: Could not connect to Polygon RPC")
-    print("Please check your internet connection")
-    exit(1)
-
-print(f"Connected to Polygon (Chain ID: {w3.eth.chain_id})")
+w3 = create_web3(RPC_URL)
 
 # Get private key and account
 private_key = Config.PRIVATE_KEY
@@ -54,17 +25,20 @@ wallet_address = account.address
 print(f"Wallet: {wallet_address}")
 
 # Create USDC contract instance
-usdc_contract = w3.eth.contract(
-    address=Web3.to_checksum_address(USDC_ADDRESS),
-    abi=ERC20_ABI
-)
+usdc_contract = usdc(w3)
 
-# Check current allowance
+# Check current allowance first: the allowance read doubles as the connectivity
+# check, so the already-approved path costs a single RPC call
 print(f"\nChecking current USDC allowance...")
-current_allowance = usdc_contract.functions.allowance(
-    Web3.to_checksum_address(wallet_address),
-    Web3.to_checksum_address(EXCHANGE_ADDRESS)
-).call()
+try:
+    current_allowance = usdc_contract.functions.allowance(
+        wallet_address,
+        EXCHANGE_ADDRESS
+    ).call()
+except Exception as e:
+    print(f"ERROR: Could not connect to Polygon RPC: {e}")
+    print("Please check your internet connection")
+    exit(1)
 
 current_allowance_usdc = current_allowance / 1_000_000  # USDC has 6 decimals
 print(f"Current allowance: ${current_allowance_usdc:,.2f} USDC")
@@ -82,23 +56,25 @@ print(f"  Amount: {approve_amount}")
 
 # Build transaction
 nonce = w3.eth.get_transaction_count(wallet_address)
-gas_price = w3.eth.gas_price
+max_fee, priority_fee = fees_from_history(w3.eth.fee_history(5, 'latest', [50]))
 
 print(f"\nBuilding transaction...")
 print(f"  Nonce: {nonce}")
-print(f"  Gas Price: {w3.from_wei(gas_price, 'gwei')} gwei")
+print(f"  Max Fee: {w3.from_wei(max_fee, 'gwei')} gwei (priority {w3.from_wei(priority_fee, 'gwei')} gwei)")
 
-# Build approve transaction
-approve_txn = usdc_contract.functions.approve(
-    Web3.to_checksum_address(EXCHANGE_ADDRESS),
-    approve_amount
-).build_transaction({
+# Build approve transaction from precomputed calldata
+approve_txn = {
     'from': wallet_address,
+    'to': USDC_ADDRESS,
+    'data': encode_approve(EXCHANGE_ADDRESS, approve_amount),
+    'value': 0,
     'nonce': nonce,
     'gas': 100000,  # Typical gas limit for ERC20 approve
-    'gasPrice': gas_price,
+    'maxFeePerGas': max_fee,
+    'maxPriorityFeePerGas': priority_fee,
+    'type': 2,
     'chainId': 137
-})
+}
 
 # Estimate gas
 try:
@@ -107,8 +83,8 @@ try:
     print(f"  Estimated Gas: {estimated_gas}")
     print(f"  Gas Limit (with buffer): {approve_txn['gas']}")
 
-    # Calculate cost
-    tx_cost_wei = approve_txn['gas'] * gas_price
+    # Calculate worst-case cost
+    tx_cost_wei = approve_txn['gas'] * max_fee
     tx_cost_matic = w3.from_wei(tx_cost_wei, 'ether')
     print(f"  Transaction Cost: {tx_cost_matic:.6f} MATIC")
 except Exception as e:
@@ -117,7 +93,7 @@ except Exception as e:
 
 # Sign transaction
 print(f"\nSigning transaction...")
-signed_txn = w3.eth.account.sign_transaction(approve_txn, private_key)
+signed_txn = account.sign_transaction(approve_txn)
 
 # Send transaction
 print(f"Sending transaction...")
@@ -128,7 +104,7 @@ try:
     print(f"  Explorer: https://polygonscan.com/tx/{tx_hash.hex()}")
 
     print(f"\nWaiting for confirmation...")
-    tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=180, poll_latency=1.0)
 
     if tx_receipt.status == 1:
         print(f"\nSUCCESS! USDC allowance has been set.")
@@ -1,9 +1,61 @@
 """Test script to verify Polymarket connection and configuration."""
 
+import io
 import sys
+import threading
+import time
 from config import Config
 from logger import logger
 
+# Overall budget for the network probes, which run concurrently. Gamma discovery
+# checks 48 slugs one request at a time, so this leaves room for a slow API
+PROBE_TIMEOUT_SECONDS = 30
+
+
+class _ThreadBufferedStdout:
+    """sys.stdout proxy that routes prints from capturing threads into per-thread buffers."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, fn):
+        """Wrap fn to capture its output when run on a thread; returns (runner, buffer)."""
+        buffer = io.StringIO()
+
+        def run():
+            self._local.buffer = buffer
+            try:
+                return fn()
+            finally:
+                self._local.buffer = None
+        return run, buffer
+
+
+def _start_probe(run):
+    """
+    Start a probe on a daemon thread.
+
+    Returns:
+        Tuple of (thread, outcome dict that receives "passed" when the probe ends)
+    """
+    outcome = {}
+
+    def target():
+        outcome["passed"] = run()
+
+    # Daemon threads do not block interpreter exit if a probe outlives its budget
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, outcome
+
 
 def test_configuration():
     """Test configuration loading."""
@@ -32,9 +84,9 @@ def test_gamma_api():
     print("="*60)
 
     try:
-        from market_discovery import MarketDiscovery
+        from _clients import get_discovery
 
-        discovery = MarketDiscovery()
+        discovery = get_discovery()
         print("[OK] Market discovery client initialized")
 
         print("  Fetching markets...")
@@ -64,10 +116,10 @@ def test_clob_client():
     print("="*60)
 
     try:
-        from order_manager import OrderManager
+        from _clients import get_om
 
         print("  Initializing CLOB client...")
-        manager = OrderManager(Config.PRIVATE_KEY)
+        manager = get_om()
 
         print(f"[OK] CLOB client initialized")
         print(f"  - Wallet address: {manager.address}")
@@ -102,11 +154,33 @@ def main():
     # Test configuration
     results.append(("Configuration", test_configuration()))
 
-    # Test Gamma API
-    results.append(("Gamma API", test_gamma_api()))
-
-    # Test CLOB client
-    results.append(("CLOB Client", test_clob_client()))
+    # Test Gamma API and CLOB client concurrently; both are network-bound and
+    # independent. Output is buffered per test and printed in a fixed order.
+    # A probe still running at the deadline fails instead of stalling the run
+    network_tests = [("Gamma API", test_gamma_api), ("CLOB Client", test_clob_client)]
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        probes = []
+        for name, test in network_tests:
+            run, buffer = stdout.capture(test)
+            probes.append((name, *_start_probe(run), buffer))
+
+        deadline = time.monotonic() + PROBE_TIMEOUT_SECONDS
+        outcomes = []
+        for name, thread, outcome, buffer in probes:
+            thread.join(timeout=max(0, deadline - time.monotonic()))
+            outcomes.append((name, outcome.get("passed"), buffer.getvalue()))
+    finally:
+        sys.stdout = stdout.stream
+
+    for name, passed, output in outcomes:
+        sys.stdout.write(output)
+        if passed is None:
+            # The partial output above ends at the step that hung
+            print(f"[FAIL] {name} timed out after {PROBE_TIMEOUT_SECONDS}s")
+            passed = False
+        results.append((name, passed))
 
     # Summary
     print("\n" + "="*60)
@@ -1,18 +1,16 @@
 """Test order placement with small size."""
 import sys
-from order_manager import OrderManager
-from market_discovery import MarketDiscovery
-from config import Config
+from _clients import get_om
+from market_discovery_cache import get_btc_15m_markets
 
 print('\n' + '='*60)
 print('Test Small Order Placement ($1.00)')
 print('='*60)
 
-om = OrderManager(Config.PRIVATE_KEY)
+om = get_om()
 print(f'Wallet: {om.address}')
 
-disc = MarketDiscovery()
-markets = disc.discover_btc_15m_markets()
+markets = get_btc_15m_markets()
 market = markets[0] if markets else None
 print(f'Market: {market.market_slug if market else "None"}')
 
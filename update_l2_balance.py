@@ -1,13 +1,12 @@
 """Update L2 balance allowance for Polymarket trading."""
-from order_manager import OrderManager
-from config import Config
+from _clients import get_om
 from logger import logger
 
 print('Updating L2 Balance/Allowance on Polymarket')
 print('='*60)
 
 # Initialize OrderManager
-om = OrderManager(Config.PRIVATE_KEY)
+om = get_om()
 print(f'Wallet: {om.address}\n')
 
 # Try to update balance allowance for USDC (collateral)